@@ -0,0 +1,505 @@
+"""
+Benchmark suite for every knapsack engine.
+
+Sweeps the number of items, the capacity and the standard instance classes,
+times each engine with time.perf_counter after a warmup (median and IQR over
+several repetitions), measures peak memory with tracemalloc, and writes the
+results as JSON. A stored baseline can be compared against to catch
+regressions:
+
+    python benchmark.py --n 50 200 --capacity 1000 10000 --output current.json
+    python benchmark.py --n 50 200 --capacity 1000 10000 --baseline current.json
+
+With --epsilons the FPTAS is also run at each epsilon and its achieved
+quality (value / exact optimum) and runtime are reported side by side:
+
+    python benchmark.py --engines branch_bound --n 200 --capacity 20000 --epsilons 0.5 0.1 0.01
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from batch_runner import ENGINES as VALUE_ENGINES
+from instrumentation import SolveStats
+from ks_bottom_up import ENGINES as SOLVE_ENGINES, solve_knapsack
+from ks_fptas import solve_knapsack_fptas
+
+
+INSTANCE_KINDS = ('uncorrelated', 'weakly_correlated', 'strongly_correlated', 'subset_sum')
+
+
+def generate_instance(kind, n, capacity, max_weight=1000, seed=0):
+    """
+    Generate one of the standard knapsack instance classes.
+
+    Args:
+        kind: One of INSTANCE_KINDS
+        n: Number of items
+        capacity: Maximum weight capacity
+        max_weight: Weights are drawn from 1..min(max_weight, capacity)
+        seed: Random seed
+
+    Returns:
+        tuple: (weights, values)
+    """
+    rng = random.Random(f"{kind}-{n}-{capacity}-{max_weight}-{seed}")
+    r = max(1, min(max_weight, capacity))
+    weights = [rng.randint(1, r) for _ in range(n)]
+    if kind == 'uncorrelated':
+        values = [rng.randint(1, r) for _ in range(n)]
+    elif kind == 'weakly_correlated':
+        spread = max(1, r // 10)
+        values = [max(1, w + rng.randint(-spread, spread)) for w in weights]
+    elif kind == 'strongly_correlated':
+        values = [w + max(1, r // 10) for w in weights]
+    elif kind == 'subset_sum':
+        values = list(weights)
+    else:
+        raise ValueError(f"Unknown instance kind {kind!r}, expected one of {INSTANCE_KINDS}")
+    return weights, values
+
+
+def _solve_engine(engine):
+    def run(weights, values, capacity, stats=None):
+        return solve_knapsack(weights, values, capacity, engine=engine, stats=stats)[0]
+    return run
+
+
+# name -> (callable(weights, values, capacity, stats=None) -> max value, limit)
+# limit is the largest n * W the engine is run on (None = no limit); the
+# pure-Python O(n * W) engines would otherwise dominate the sweep
+ENGINES = {
+    'knapsack': (VALUE_ENGINES['knapsack'], 2_000_000),
+    'knapsack_iterative': (VALUE_ENGINES['knapsack_iterative'], 5_000_000),
+    'knapsack_bottom_up': (VALUE_ENGINES['knapsack_bottom_up'], 2_000_000),
+    'knapsack_vectorized': (VALUE_ENGINES['knapsack_vectorized'], None),
+    'table': (_solve_engine('table'), 2_000_000),
+}
+ENGINES.update({name: (_solve_engine(name), None) for name in SOLVE_ENGINES})
+
+
+def measure(func, args, warmup=1, repeats=5, collect_stats=False):
+    """
+    Time a call with warmup and repetitions, then measure its peak memory.
+
+    Args:
+        func: Callable to benchmark
+        args: Positional arguments for func
+        warmup: Untimed calls made first
+        repeats: Timed calls
+        collect_stats: Make one more call with an instrumentation.SolveStats
+
+    Returns:
+        dict with 'result', 'times', 'median', 'iqr', 'peak_bytes' and
+        'stats' (a SolveStats dict, or None)
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start_time)
+
+    # tracemalloc slows the call down, so peak memory gets its own run
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Instrumentation is off for the timed runs, so it gets its own run too
+    stats = None
+    if collect_stats:
+        stats = SolveStats()
+        func(*args, stats=stats)
+        stats = stats.as_dict()
+
+    if len(times) >= 2:
+        q1, _, q3 = statistics.quantiles(times, n=4, method='inclusive')
+    else:
+        q1 = q3 = times[0]
+    return {
+        'result': result,
+        'times': times,
+        'median': statistics.median(times),
+        'iqr': q3 - q1,
+        'peak_bytes': peak_bytes,
+        'stats': stats,
+    }
+
+
+def _record(engine, kind, n, capacity, seed, stats, repeats):
+    return {
+        'engine': engine,
+        'kind': kind,
+        'n': n,
+        'capacity': capacity,
+        'seed': seed,
+        'value': int(stats['result']),
+        'median_s': stats['median'],
+        'iqr_s': stats['iqr'],
+        'min_s': min(stats['times']),
+        'repeats': repeats,
+        'peak_bytes': stats['peak_bytes'],
+    }
+
+
+def run_suite(engines, kinds, sizes, capacities, warmup=1, repeats=5, seed=0, collect_stats=False,
+              log=None):
+    """
+    Run every engine on every (kind, n, capacity) combination.
+
+    Args:
+        engines: Engine names (keys of ENGINES)
+        kinds: Instance kinds (subset of INSTANCE_KINDS)
+        sizes: Numbers of items
+        capacities: Capacities
+        warmup: Untimed calls before timing
+        repeats: Timed calls per measurement
+        seed: Instance seed
+        collect_stats: Add the solver's SolveStats to every record
+        log: Optional callable receiving one progress line per measurement
+
+    Returns:
+        List of result records (dicts), one per measurement
+    """
+    # Deep recursion in the top-down engine needs a higher limit
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * max(sizes) + 100))
+
+    records = []
+    for kind in kinds:
+        for n in sizes:
+            for capacity in capacities:
+                weights, values = generate_instance(kind, n, capacity, seed=seed)
+                expected = None
+                for engine in engines:
+                    func, limit = ENGINES[engine]
+                    if limit is not None and n * capacity > limit:
+                        continue
+                    stats = measure(func, (weights, values, capacity), warmup=warmup, repeats=repeats,
+                                    collect_stats=collect_stats)
+                    if expected is None:
+                        expected = stats['result']
+                    elif stats['result'] != expected:
+                        raise AssertionError(f"{engine} returned {stats['result']} instead of {expected} "
+                                             f"on {kind} n={n} W={capacity}")
+                    record = _record(engine, kind, n, capacity, seed, stats, repeats)
+                    if collect_stats:
+                        record['stats'] = stats['stats']
+                    records.append(record)
+                    if log is not None:
+                        log(f"{engine:>20} {kind:>20} n={n:<6} W={capacity:<9} "
+                            f"median={record['median_s']:.6f}s iqr={record['iqr_s']:.6f}s "
+                            f"peak={record['peak_bytes'] / 1e6:.2f}MB")
+    return records
+
+
+def fptas_tradeoff(epsilons, kinds, sizes, capacities, warmup=1, repeats=5, seed=0, log=None):
+    """
+    Measure the FPTAS quality/runtime trade-off against the exact optimum.
+
+    Args:
+        epsilons: Approximation parameters to try
+        kinds: Instance kinds (subset of INSTANCE_KINDS)
+        sizes: Numbers of items
+        capacities: Capacities
+        warmup: Untimed calls before timing
+        repeats: Timed calls per measurement
+        seed: Instance seed
+        log: Optional callable receiving one progress line per measurement
+
+    Returns:
+        List of result records (dicts), one per (instance, epsilon)
+    """
+    records = []
+    for kind in kinds:
+        for n in sizes:
+            for capacity in capacities:
+                weights, values = generate_instance(kind, n, capacity, seed=seed)
+                optimum = solve_knapsack(weights, values, capacity, engine='branch_bound')[0]
+                exact = measure(_solve_engine('branch_bound'), (weights, values, capacity),
+                                warmup=warmup, repeats=repeats)
+                for epsilon in epsilons:
+                    stats = measure(solve_knapsack_fptas, (weights, values, capacity, epsilon),
+                                    warmup=warmup, repeats=repeats)
+                    value, _, upper_bound = stats['result']
+                    record = {
+                        'epsilon': epsilon,
+                        'kind': kind,
+                        'n': n,
+                        'capacity': capacity,
+                        'seed': seed,
+                        'value': int(value),
+                        'optimum': int(optimum),
+                        'upper_bound': int(upper_bound),
+                        'quality': value / optimum if optimum else 1.0,
+                        'median_s': stats['median'],
+                        'exact_median_s': exact['median'],
+                        'peak_bytes': stats['peak_bytes'],
+                    }
+                    records.append(record)
+                    if log is not None:
+                        log(f"{'fptas eps=' + str(epsilon):>20} {kind:>20} n={n:<6} W={capacity:<9} "
+                            f"quality={record['quality']:.6f} median={record['median_s']:.6f}s "
+                            f"(exact {record['exact_median_s']:.6f}s)")
+    return records
+
+
+def _key(record):
+    return (record['engine'], record['kind'], record['n'], record['capacity'], record['seed'])
+
+
+def _timed_pairs(records, baseline, min_seconds):
+    by_key = {_key(r): r for r in baseline}
+    for record in records:
+        old = by_key.get(_key(record))
+        if old is not None and max(record['min_s'], old['min_s']) >= min_seconds:
+            yield record, old
+
+
+def machine_drift(records, baseline, min_seconds=1e-3):
+    """
+    Median slowdown over every compared entry, at least 1.
+
+    When the whole machine is slower than when the baseline was taken (a
+    busy neighbour, a throttled CPU), every engine slows down by about the
+    same factor. compare divides that factor out, so only engines that got
+    slower relative to the rest are reported.
+    """
+    ratios = [record['min_s'] / old['min_s'] for record, old in _timed_pairs(records, baseline, min_seconds)
+              if old['min_s'] > 0]
+    return max(statistics.median(ratios), 1.0) if ratios else 1.0
+
+
+def compare(records, baseline, threshold=0.25, min_seconds=1e-3, drift=1.0):
+    """
+    Compare results against a baseline run.
+
+    Timings are compared by their fastest repetition (min_s), which
+    scheduler noise can only push up, never down, after scaling the
+    baseline by drift (see machine_drift). A slowdown is only reported when
+    it is above threshold and also larger than the spread of the two runs
+    (the sum of their IQRs). Use confirm to re-measure the reported entries
+    before failing on them.
+
+    Args:
+        records: Current result records
+        baseline: Baseline result records
+        threshold: Allowed relative slowdown (0.25 = 25%)
+        min_seconds: Timings below this in both runs are treated as noise
+        drift: Machine-wide slowdown factor to allow for
+
+    Returns:
+        List of (record, baseline_record, message) for every regression or
+        result mismatch
+    """
+    by_key = {_key(r): r for r in baseline}
+    problems = []
+    for record in records:
+        old = by_key.get(_key(record))
+        if old is None:
+            continue
+        if record['value'] != old['value']:
+            problems.append((record, old, f"value changed {old['value']} -> {record['value']}"))
+        elif max(record['min_s'], old['min_s']) >= min_seconds:
+            expected = old['min_s'] * drift
+            if (record['min_s'] > expected * (1 + threshold)
+                    and record['min_s'] - expected > record['iqr_s'] + old['iqr_s'] * drift):
+                ratio = record['min_s'] / old['min_s']
+                problems.append((record, old, f"{ratio:.2f}x slower ({old['min_s']:.6f}s -> {record['min_s']:.6f}s)"))
+    return problems
+
+
+def _remeasure(record, warmup, repeats):
+    engine, kind, n, capacity, seed = _key(record)
+    func, _ = ENGINES[engine]
+    weights, values = generate_instance(kind, n, capacity, seed=seed)
+    stats = measure(func, (weights, values, capacity), warmup=warmup, repeats=repeats)
+    return _record(engine, kind, n, capacity, seed, stats, repeats)
+
+
+def confirm(problems, baseline=(), reruns=5, warmup=1, repeats=5, threshold=0.25, min_seconds=1e-3,
+            drift=1.0, controls=3):
+    """
+    Re-measure reported slowdowns and keep those that are still there.
+
+    Scheduler noise on a shared machine comes in bursts that can last for a
+    whole measurement, and pure-Python engines feel it more than NumPy ones.
+    So the reported entries are re-measured round-robin, reruns times each,
+    together with up to controls unreported baseline entries per report
+    (the same engine first, then closest in duration). Each entry keeps its
+    fastest rerun, and a report is kept only if that still regresses against
+    the drift of its own controls. Value mismatches are kept as they are;
+    they do not depend on timing.
+
+    Args:
+        problems: Output of compare
+        baseline: Baseline result records the control entries come from
+            (without them the drift argument is used)
+        reruns: Rounds of re-measurement
+        warmup: Untimed calls before timing
+        repeats: Timed calls per measurement
+        threshold: As in compare
+        min_seconds: As in compare
+        drift: As in compare
+        controls: Unreported entries re-measured per report
+
+    Returns:
+        The problems that persisted
+    """
+    timed = [(record, old) for record, old, _ in problems if record['value'] == old['value']]
+    flagged = {_key(record) for record, _, _ in problems}
+    candidates = [old for old in baseline
+                  if _key(old) not in flagged and old['engine'] in ENGINES and old['min_s'] >= min_seconds and old['min_s'] > 0]
+    nearest = {}
+    for _, old in timed:
+        scale = max(old['min_s'], 1e-9)
+        nearest[_key(old)] = sorted(candidates, key=lambda c: (c['engine'] != old['engine'],
+                                                               abs(math.log(c['min_s'] / scale))))[:controls]
+
+    olds = {_key(old): old for _, old in timed}
+    olds.update((_key(c), c) for chosen in nearest.values() for c in chosen)
+    best = {}
+    for _ in range(reruns):
+        for key, old in olds.items():
+            rerun = _remeasure(old, warmup, repeats)
+            if key not in best or rerun['min_s'] < best[key]['min_s']:
+                best[key] = rerun
+
+    def persists(old):
+        chosen = nearest[_key(old)]
+        local = machine_drift([best[_key(c)] for c in chosen], chosen, min_seconds) if chosen else drift
+        return compare([best[_key(old)]], [old], threshold=threshold, min_seconds=min_seconds, drift=local)
+
+    return [(record, old, message) for record, old, message in problems
+            if record['value'] != old['value'] or reruns < 1 or persists(old)]
+
+
+def environment():
+    """Describe the machine and library versions the results were taken on."""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the knapsack engines.")
+    parser.add_argument('--engines', nargs='+', default=sorted(ENGINES), choices=sorted(ENGINES))
+    parser.add_argument('--kinds', nargs='+', default=list(INSTANCE_KINDS), choices=INSTANCE_KINDS)
+    parser.add_argument('--n', nargs='+', type=int, default=[30, 100, 300])
+    parser.add_argument('--capacity', nargs='+', type=int, default=[100, 1000, 10000])
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stats', action='store_true',
+                        help="also record each solver's instrumentation counters")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--baseline', help="compare against this JSON file and fail on regressions")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed relative slowdown against the baseline (default 0.25)")
+    parser.add_argument('--min-seconds', type=float, default=1e-3,
+                        help="timings below this in both runs are not compared (default 0.001)")
+    parser.add_argument('--confirm', type=int, default=5,
+                        help="rounds of re-measuring slowdowns before failing on them (default 5)")
+    parser.add_argument('--epsilons', nargs='+', type=float, default=[],
+                        help="also report the FPTAS quality/runtime trade-off at these epsilons")
+    args = parser.parse_args(argv)
+
+    records = run_suite(args.engines, args.kinds, args.n, args.capacity,
+                        warmup=args.warmup, repeats=args.repeats, seed=args.seed,
+                        collect_stats=args.stats, log=print)
+    fptas_records = []
+    if args.epsilons:
+        fptas_records = fptas_tradeoff(args.epsilons, args.kinds, args.n, args.capacity,
+                                       warmup=args.warmup, repeats=args.repeats, seed=args.seed, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': records, 'fptas': fptas_records}, f, indent=2)
+        print(f"  ✓ Saved: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        drift = machine_drift(records, baseline, min_seconds=args.min_seconds)
+        print(f"Machine-wide slowdown against the baseline: {drift:.2f}x")
+        problems = compare(records, baseline, threshold=args.threshold, min_seconds=args.min_seconds, drift=drift)
+        problems = confirm(problems, baseline, reruns=args.confirm, warmup=args.warmup, repeats=args.repeats,
+                           threshold=args.threshold, min_seconds=args.min_seconds, drift=drift)
+        for record, _, message in problems:
+            print(f"REGRESSION {record['engine']} {record['kind']} n={record['n']} W={record['capacity']}: {message}")
+        if problems:
+            return 1
+        print("No regressions against the baseline.")
+    return 0
+
+
+def test():
+    # generate_instance: the classes keep their defining relations
+    for kind in INSTANCE_KINDS:
+        weights, values = generate_instance(kind, 200, 500, seed=13)
+        assert len(weights) == len(values) == 200 and all(1 <= w <= 500 for w in weights)
+        assert generate_instance(kind, 200, 500, seed=13) == (weights, values)
+        if kind == 'subset_sum':
+            assert values == weights
+        elif kind == 'strongly_correlated':
+            assert all(v == w + 50 for w, v in zip(weights, values))
+        elif kind == 'weakly_correlated':
+            assert all(v >= 1 and abs(v - w) <= 50 for w, v in zip(weights, values))
+    try:
+        generate_instance('nope', 1, 1)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    # compare on synthetic records
+    def record(min_s, iqr_s=0.0, value=10, n=1):
+        return {'engine': 'table', 'kind': 'uncorrelated', 'n': n, 'capacity': 100, 'seed': 0,
+                'value': value, 'median_s': min_s, 'min_s': min_s, 'iqr_s': iqr_s}
+
+    old = record(0.010, iqr_s=0.001)
+    assert compare([record(0.010, value=11)], [old])[0][2] == "value changed 10 -> 11"
+    assert "2.00x slower" in compare([record(0.020, iqr_s=0.001)], [old])[0][2]
+    assert compare([record(0.012, iqr_s=0.001)], [old]) == []               # under threshold
+    assert compare([record(0.020, iqr_s=0.012)], [old]) == []               # within the runs' IQRs
+    assert compare([record(0.0008)], [record(0.0002)]) == []                # below min_seconds
+    assert len(compare([record(0.0008)], [record(0.0002)], min_seconds=1e-4)) == 1
+    assert compare([record(0.020, n=2)], [old]) == []                       # no baseline entry
+
+    # a slowdown shared by every engine is the machine, not a regression
+    baseline = [dict(record(0.010 * k, iqr_s=0.0002), engine=f'e{k}') for k in range(1, 6)]
+    current = [dict(r, min_s=r['min_s'] * 1.7) for r in baseline]
+    current[2] = dict(current[2], min_s=baseline[2]['min_s'] * 4)
+    drift = machine_drift(current, baseline)
+    assert abs(drift - 1.7) < 1e-9
+    assert len(compare(current, baseline)) == 5
+    assert [problem[0]['engine'] for problem in compare(current, baseline, drift=drift)] == ['e3']
+    assert machine_drift([dict(r, min_s=r['min_s'] / 2) for r in baseline], baseline) == 1.0
+
+    # confirm keeps value mismatches without re-measuring, and everything with no reruns
+    mismatch = compare([record(0.010, value=11)], [old])
+    assert confirm(mismatch) == confirm(mismatch, baseline) == mismatch
+    slow = compare([record(0.020, iqr_s=0.001)], [old])
+    assert confirm(slow, baseline, reruns=0) == slow
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,10 @@ from ks_top_down import knapsack
 def average_knapsack_time(num_trials, n_items, max_weight, max_value, max_capacity):
     total_time = 0
     time_list = []
+
+    # Warm up once so the first timed trial doesn't pay for cold caches
+    knapsack(2, 2, [1, 1], [1, 1], {})
+
     for i in range(num_trials):
 
         weights = [random.randint(1, max_weight) for j in range(n_items)]
@@ -14,10 +18,11 @@ def average_knapsack_time(num_trials, n_items, max_weight, max_value, max_capaci
         capacity = random.randint(1, max_capacity)
         memo = {}
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         knapsack(n_items, capacity, weights, values, memo)
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time += (end_time - start_time)
+        time_list.append(end_time - start_time)
 
     average_time = total_time / num_trials
     return average_time, time_list
@@ -26,5 +31,6 @@ if __name__ == "__main__":
 
     avg_time, lis = average_knapsack_time(100, 30, 200, 400, 100)
     print(f"Average runtime over 100 trials: {avg_time:.6f} seconds")
+    print("For medians, IQR, peak memory and more sizes run: python benchmark.py")
 
     
\ No newline at end of file
@@ -0,0 +1,45 @@
+import os
+import time
+import random
+import numpy as np
+from ks_vectorized import knapsack_row
+from ks_parallel import knapsack_row_parallel
+
+
+def time_call(func, *args, **kwargs):
+    start_time = time.perf_counter()
+    result = func(*args, **kwargs)
+    end_time = time.perf_counter()
+    return result, end_time - start_time
+
+
+def scaling(n_items, capacity, max_workers, trials=3, seed=0):
+    rng = random.Random(seed)
+    weights = [rng.randint(1, capacity // 2) for j in range(n_items)]
+    values = [rng.randint(1, 400) for k in range(n_items)]
+
+    serial_row, serial_time = time_call(knapsack_row, weights, values, capacity)
+    results = [(0, serial_time)]
+
+    for workers in range(1, max_workers + 1):
+        times = []
+        for t in range(trials):
+            row, elapsed = time_call(knapsack_row_parallel, weights, values, capacity, workers=workers)
+            assert np.array_equal(row, serial_row), f"{workers} workers differ from the serial row"
+            times.append(elapsed)
+        results.append((workers, sorted(times)[len(times) // 2]))
+
+    return results
+
+
+if __name__ == "__main__":
+
+    n_items, capacity = 500, 2_000_000
+    max_workers = os.cpu_count() or 1
+    print(f"n={n_items}, W={capacity}, up to {max_workers} workers (median of 3 runs)")
+    results = scaling(n_items, capacity, max_workers)
+    serial_time = results[0][1]
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>8}")
+    for workers, elapsed in results:
+        label = 'serial' if workers == 0 else str(workers)
+        print(f"{label:>8} {elapsed:>10.4f} {serial_time / elapsed:>7.2f}x")
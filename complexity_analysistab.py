@@ -5,6 +5,9 @@ from ks_bottom_up import knapsack_bottom_up
 def average_knapsack_time(num_trials, n_items, max_weight, max_value, max_capacity):
     total_time = 0
 
+    # Warm up once so the first timed trial doesn't pay for cold caches
+    knapsack_bottom_up(2, 2, [1, 1], [1, 1])
+
     for i in range(num_trials):
 
         weights = [random.randint(1, max_weight) for j in range(n_items)]
@@ -13,9 +16,9 @@ def average_knapsack_time(num_trials, n_items, max_weight, max_value, max_capaci
         capacity = random.randint(1, max_capacity)
         memo = {}
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         knapsack_bottom_up(n_items, capacity, weights, values)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         total_time += (end_time - start_time)
 
@@ -25,4 +28,5 @@ def average_knapsack_time(num_trials, n_items, max_weight, max_value, max_capaci
 if __name__ == "__main__":
 
     avg_time = average_knapsack_time(100, 30, 200, 400, 100)
-    print(f"Average runtime over 100 trials: {avg_time:.6f} seconds")
\ No newline at end of file
+    print(f"Average runtime over 100 trials: {avg_time:.6f} seconds")
+    print("For medians, IQR, peak memory and more sizes run: python benchmark.py")
\ No newline at end of file
@@ -0,0 +1,36 @@
+import time
+import random
+from ks_bottom_up import knapsack_bottom_up
+from ks_vectorized import knapsack_vectorized
+
+
+def time_call(func, *args):
+    start_time = time.perf_counter()
+    result = func(*args)
+    end_time = time.perf_counter()
+    return result, end_time - start_time
+
+
+def compare_engines(n_items, capacity, max_weight, max_value, seed=0):
+    rng = random.Random(seed)
+    weights = [rng.randint(1, max_weight) for j in range(n_items)]
+    values = [rng.randint(1, max_value) for k in range(n_items)]
+
+    # Warm up both engines on a tiny instance so import/allocation costs are not timed
+    knapsack_bottom_up(2, 2, [1, 1], [1, 1])
+    knapsack_vectorized(2, 2, [1, 1], [1, 1])
+
+    loop_value, loop_time = time_call(knapsack_bottom_up, n_items, capacity, weights, values)
+    vec_value, vec_time = time_call(knapsack_vectorized, n_items, capacity, weights, values)
+    assert loop_value == vec_value, f"Engines disagree: {loop_value} != {vec_value}"
+
+    return loop_time, vec_time
+
+
+if __name__ == "__main__":
+
+    print(f"{'n':>6} {'W':>8} {'n*W':>12} {'loop (s)':>10} {'numpy (s)':>10} {'speedup':>8}")
+    for n_items, capacity in [(30, 100), (100, 1000), (200, 10000), (500, 10000), (1000, 10000)]:
+        loop_time, vec_time = compare_engines(n_items, capacity, max_weight=capacity // 2, max_value=400)
+        print(f"{n_items:>6} {capacity:>8} {n_items * capacity:>12} "
+              f"{loop_time:>10.4f} {vec_time:>10.4f} {loop_time / vec_time:>7.1f}x")
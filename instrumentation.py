@@ -0,0 +1,152 @@
+"""
+Low-overhead solver instrumentation.
+
+Solvers take an optional ``stats`` argument (None by default). When it is
+None they skip every counter, so the only cost of the feature is an
+``is not None`` check. When a SolveStats is passed it is filled in place,
+the same way a caller-supplied memo_table is, and can be handed straight to
+KnapsackVisualizer.compare_approaches or the benchmark tools.
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class SolveStats:
+    """
+    Counters and per-phase timings collected during one solve.
+    """
+
+    def __init__(self):
+        self.states_computed = 0   # DP cells / memo states actually computed
+        self.memo_hits = 0         # lookups answered from the memo
+        self.memo_misses = 0       # lookups that had to compute the state
+        self.peak_memo_size = 0    # largest number of stored states
+        self.space = 0             # states kept in memory by the solver
+        self.depth = 0             # current recursion / stack depth
+        self.max_depth = 0         # deepest recursion / stack reached
+        self.phases = {}           # phase name -> {'wall': s, 'cpu': s}
+        self.counters = {}         # engine-specific counters (e.g. nodes_pruned)
+        self._started = {}
+
+    def start(self, name):
+        """Start timing a phase (e.g. 'fill' or 'reconstruct')."""
+        self._started[name] = (time.perf_counter(), time.process_time())
+
+    def stop(self, name):
+        """Stop timing a phase; repeated phases accumulate."""
+        wall_start, cpu_start = self._started.pop(name)
+        phase = self.phases.setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+        phase['wall'] += time.perf_counter() - wall_start
+        phase['cpu'] += time.process_time() - cpu_start
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager version of start/stop."""
+        self.start(name)
+        try:
+            yield self
+        finally:
+            self.stop(name)
+
+    def enter(self):
+        """Record one level deeper in the recursion or work stack."""
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def leave(self):
+        """Record leaving one level of recursion."""
+        self.depth -= 1
+
+    @property
+    def time(self):
+        """Total wall time over all phases."""
+        return sum(phase['wall'] for phase in self.phases.values())
+
+    @property
+    def cpu_time(self):
+        """Total CPU time over all phases."""
+        return sum(phase['cpu'] for phase in self.phases.values())
+
+    def as_dict(self):
+        """
+        Plain dict of every figure, JSON-serializable.
+
+        Returns:
+            dict with 'time', 'space' and 'states_computed' (the keys
+            compare_approaches reads) plus the remaining counters
+        """
+        result = {
+            'time': self.time,
+            'cpu_time': self.cpu_time,
+            'space': self.space,
+            'states_computed': self.states_computed,
+            'memo_hits': self.memo_hits,
+            'memo_misses': self.memo_misses,
+            'peak_memo_size': self.peak_memo_size,
+            'max_depth': self.max_depth,
+            'phases': {name: dict(phase) for name, phase in self.phases.items()},
+        }
+        result.update(self.counters)
+        return result
+
+    def __getitem__(self, key):
+        # Lets SolveStats stand in for the stats dicts compare_approaches expects
+        return self.as_dict()[key]
+
+    def __setitem__(self, key, value):
+        # Lets solvers that report into a plain dict (e.g. branch and bound)
+        # report into SolveStats as well
+        self.counters[key] = value
+
+    def __repr__(self):
+        return f"SolveStats({self.as_dict()})"
+
+
+def test():
+    from ks_bottom_up import knapsack_bottom_up, solve_knapsack
+    from ks_branch_bound import solve_knapsack_branch_bound
+    from ks_top_down import knapsack, knapsack_iterative, new_flat_memo
+
+    w = [2, 3, 4, 5, 6]
+    v = [3, 4, 8, 8, 10]
+    capacity = 20
+
+    # Test 1: top-down counts one miss per stored state
+    memo = {}
+    top_down = SolveStats()
+    assert knapsack(len(w), capacity, w, v, memo, stats=top_down) == 33
+    assert top_down.states_computed == top_down.memo_misses == len(memo) == top_down.peak_memo_size
+    assert top_down.max_depth == len(w) and top_down.depth == 0
+    assert 'fill' in top_down.phases
+
+    # Test 2: iterative top-down computes the same states
+    iterative = SolveStats()
+    knapsack_iterative(len(w), capacity, w, v, new_flat_memo(len(w), capacity), stats=iterative)
+    assert iterative.states_computed == len(memo)
+    assert (iterative.memo_hits, iterative.space) == (top_down.memo_hits, top_down.space)
+
+    # Test 3: table engine reports both phases, value-only solver reports fill
+    bottom_up = SolveStats()
+    solve_knapsack(w, v, capacity, stats=bottom_up)
+    assert set(bottom_up.phases) == {'fill', 'reconstruct'}
+    assert bottom_up['states_computed'] == len(w) * (capacity + 1)
+    plain = SolveStats()
+    knapsack_bottom_up(len(w), capacity, w, v, stats=plain)
+    assert plain['space'] == (len(w) + 1) * (capacity + 1)
+
+    # Test 4: engine-specific counters
+    bb = SolveStats()
+    solve_knapsack_branch_bound(w, v, capacity, stats=bb)
+    assert bb['nodes_explored'] >= 1
+
+    # Test 5: the keys compare_approaches reads
+    for stats in (bottom_up, top_down):
+        assert stats['time'] >= 0 and stats['space'] > 0 and stats['states_computed'] > 0
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
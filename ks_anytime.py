@@ -0,0 +1,289 @@
+"""
+Anytime solver with a time and memory budget.
+
+solve_knapsack_anytime returns within time_limit seconds with the best
+solution found so far, a proven upper bound on the optimum and the
+remaining gap:
+
+1. Greedy by ratio gives an incumbent immediately; the Dantzig bound gives
+   the first upper bound. Both come from one vectorized NumPy pass that
+   cannot be interrupted, so a budget below min_time_limit(n) (about
+   GREEDY_SECONDS_PER_ITEM per item, 0.6 s for 300,000 items) is rejected
+   up front rather than silently overrun.
+2. ks_reduction shrinks the instance to a core (dominated items dropped,
+   items fixed in or out by bounds), which often tightens the bound.
+3. Branch and bound on the core, with a deadline, improves the incumbent
+   and proves optimality when it finishes.
+4. If the core's bit-packed DP fits in memory_limit, it is filled item by
+   item in ratio order with the rest of the time. Stopped early, the rows
+   done so far still give the best selection among the leading items.
+
+Phases 2-4 run in pure Python and start with a sort that cannot be
+interrupted, so each is skipped (returning the best so far) unless about
+SECONDS_PER_ITEM per item of time is left for it; inside a phase the clock
+is checked as it goes. Every better solution is passed to the optional
+progress callback.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from ks_bitset import backtrack_bits
+from ks_branch_bound import dantzig_bound, greedy_by_ratio, solve_knapsack_branch_bound
+from ks_reduction import expand_solution, reduce_instance
+from ks_vectorized import apply_item_with_decision, check_dtype
+
+
+AnytimeResult = namedtuple('AnytimeResult', [
+    'value',           # value of selected_items
+    'selected_items',  # best selection found (original indices)
+    'upper_bound',     # proven: no solution is worth more
+    'gap',             # (upper_bound - value) / upper_bound, 0 when optimal
+    'optimal',         # True once value == upper_bound
+    'elapsed',         # seconds since the call started
+    'phase',           # 'greedy', 'reduction', 'branch_bound' or 'dp'
+])
+
+
+# Rough upper estimate of the time one pure-Python phase (reduction or
+# branch-and-bound setup, sorts included) takes per item
+SECONDS_PER_ITEM = 2e-5
+
+# Upper estimate of the vectorized greedy pass (list conversion included)
+# per item; about 0.35 us per item idle, with headroom for a loaded machine
+GREEDY_SECONDS_PER_ITEM = 2e-6
+
+
+def dp_memory(n, capacity):
+    """Bytes for the rolling int64 row plus n rows of packed decision bits."""
+    return 8 * (capacity + 1) + n * ((capacity + 8) // 8)
+
+
+def min_time_limit(n):
+    """Shortest time_limit accepted for n items: the greedy pass always runs."""
+    return GREEDY_SECONDS_PER_ITEM * n
+
+
+def _fits_int64(numbers):
+    """True when the positive numbers sum to something int64 can hold."""
+    try:
+        check_dtype(numbers, np.int64)
+    except ValueError:
+        return False
+    return True
+
+
+def greedy_and_bound(weights, values, capacity):
+    """
+    greedy_by_ratio and dantzig_bound in one vectorized pass.
+
+    Sums that could overflow int64 are left to the pure-Python pair.
+
+    Returns:
+        tuple: (value, selected_items, upper_bound)
+    """
+    if not (_fits_int64(values) and _fits_int64(weights)):
+        value, selected_items = greedy_by_ratio(weights, values, capacity)
+        return value, selected_items, dantzig_bound(weights, values, capacity)
+
+    w = np.asarray(weights, dtype=np.int64).reshape(-1)
+    v = np.asarray(values).reshape(-1)
+    if not v.size:
+        v = v.astype(np.int64)
+    forced = np.flatnonzero((v > 0) & (w == 0))
+    candidates = np.flatnonzero((v > 0) & (w > 0) & (w <= capacity))
+    # stable sort keeps the index tie-break of _sorted_candidates
+    order = candidates[np.argsort(-(v[candidates] / w[candidates]), kind='stable')]
+    prefix_weights = np.cumsum(w[order])
+    k = int(np.searchsorted(prefix_weights, capacity, side='right'))  # items order[:k] fit
+    remaining = capacity - (int(prefix_weights[k - 1]) if k else 0)
+    forced_value = v[forced].sum().item()
+    prefix_value = v[order[:k]].sum().item()
+
+    upper = forced_value + prefix_value
+    if k < len(order):
+        critical = order[k]
+        if v.dtype.kind in 'iu':
+            upper += remaining * int(v[critical]) // int(w[critical])
+        else:
+            upper += remaining * float(v[critical]) / int(w[critical])
+
+    # Greedy keeps going past the critical item with whatever still fits
+    rest = order[k:]
+    rest = rest[w[rest] <= remaining]
+    extra = []
+    for i, weight in zip(rest.tolist(), w[rest].tolist()):
+        if weight <= remaining:
+            extra.append(i)
+            remaining -= weight
+    selected = np.sort(np.concatenate([forced, order[:k], np.asarray(extra, dtype=np.intp)]))
+    return v[selected].sum().item() if len(selected) else 0, selected.tolist(), upper
+
+
+def solve_knapsack_anytime(weights, values, capacity, time_limit=1.0, memory_limit=256 * 1024 * 1024,
+                           callback=None):
+    """
+    Solve 0/1 knapsack within a time and memory budget.
+
+    Args:
+        weights: List of item weights
+        values: List of non-negative integer item values
+        capacity: Maximum weight capacity
+        time_limit: Seconds before the best solution so far is returned
+        memory_limit: Largest DP (row + decision bits) to allocate, in bytes
+        callback: Optional callable(AnytimeResult) called on every improvement
+
+    Returns:
+        AnytimeResult
+
+    Raises:
+        ValueError: If time_limit is below min_time_limit(len(weights))
+    """
+    if time_limit < min_time_limit(len(weights)):
+        raise ValueError(f"time_limit {time_limit}s is below the {min_time_limit(len(weights)):.3g}s "
+                         f"the first pass needs for {len(weights)} items")
+    start = time.perf_counter()
+    deadline = start + time_limit
+    greedy_value, greedy_items, upper = greedy_and_bound(weights, values, capacity)
+    best = {'value': -1, 'items': [], 'upper': upper, 'phase': 'greedy'}
+
+    def result():
+        value, upper = best['value'], max(best['upper'], best['value'])
+        return AnytimeResult(value, list(best['items']), upper, (upper - value) / upper if upper else 0.0,
+                             value == upper, time.perf_counter() - start, best['phase'])
+
+    def improve(value, items, phase):
+        if value > best['value']:
+            best.update(value=value, items=items, phase=phase)
+            if callback is not None:
+                callback(result())
+
+    def has_time(n_items):
+        return time.perf_counter() + SECONDS_PER_ITEM * n_items <= deadline
+
+    improve(greedy_value, greedy_items, 'greedy')
+    if best['value'] >= best['upper'] or not has_time(len(weights)):
+        return result()
+
+    # Reduction keeps every optimum, so fixed value + core bound is still an upper bound
+    reduced = reduce_instance(weights, values, capacity, deadline=deadline)
+    core_weights, core_values, core_capacity = reduced.weights, reduced.values, reduced.capacity
+    core_value, core_items, core_upper = greedy_and_bound(core_weights, core_values, core_capacity)
+    best['upper'] = min(best['upper'], reduced.fixed_value + core_upper)
+    improve(*expand_solution(reduced, core_value, core_items), 'reduction')
+    if best['value'] >= best['upper']:
+        best['phase'] = 'reduction'
+        return result()
+    if not has_time(len(core_weights)):
+        return result()
+
+    # Branch and bound first; leave most of the time to the DP when it fits
+    dp_fits = dp_memory(len(core_weights), core_capacity) <= memory_limit and _fits_int64(core_values)
+    bb_deadline = start + time_limit / 4 if dp_fits else deadline
+    stats = {}
+    solve_knapsack_branch_bound(core_weights, core_values, core_capacity, stats=stats,
+                                deadline=max(bb_deadline, time.perf_counter()),
+                                on_improve=lambda v, s: improve(*expand_solution(reduced, v, s), 'branch_bound'))
+    best['upper'] = min(best['upper'], reduced.fixed_value + stats['upper_bound'])
+    if not stats['timed_out'] or best['value'] >= best['upper'] or not dp_fits:
+        return result()
+
+    # DP over the core in ratio order, checking the clock after every item
+    order = sorted(range(len(core_weights)), key=lambda i: -core_values[i] / core_weights[i])
+    order_weights = [core_weights[i] for i in order]
+    row = np.zeros(core_capacity + 1, dtype=np.int64)
+    bits = np.zeros((len(order), (core_capacity + 8) // 8), dtype=np.uint8)
+    done = 0
+    for i in order:
+        if time.perf_counter() >= deadline:
+            break
+        bits[done] = np.packbits(apply_item_with_decision(row, core_weights[i], core_values[i]))
+        done += 1
+
+    prefix_items = [order[p] for p in backtrack_bits(bits, order_weights, core_capacity, n=done)]
+    improve(*expand_solution(reduced, int(row[core_capacity]), sorted(prefix_items)), 'dp')
+    if done == len(order):
+        best['upper'] = best['value']
+        best['phase'] = 'dp'
+    return result()
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: small instance is solved to optimality
+    result = solve_knapsack_anytime([4, 2, 3], [10, 4, 7], 5)
+    assert result.value == 11 and result.selected_items == [1, 2] and result.optimal, f"Test 1 Failed: {result}"
+
+    # Test 2: a tight budget still returns a feasible answer with a valid gap
+    rng = random.Random(23)
+    w2 = [rng.randint(10**5, 10**6) for _ in range(3000)]
+    v2 = [w + rng.randint(0, 10**5) for w in w2]
+    capacity2 = sum(w2) // 2
+    reports = []
+    result = solve_knapsack_anytime(w2, v2, capacity2, time_limit=0.05, callback=reports.append)
+    assert result.elapsed < 1.0, f"Test 2 Failed: took {result.elapsed}s"
+    assert sum(w2[i] for i in result.selected_items) <= capacity2
+    assert result.value == sum(v2[i] for i in result.selected_items) <= result.upper_bound
+    assert reports and [r.value for r in reports] == sorted({r.value for r in reports})
+    assert 0 <= result.gap < 0.01
+
+    # Test 3: strongly correlated, branch and bound runs out of its share of
+    # the time and the DP phase finishes the proof
+    rng3 = random.Random(2)
+    w3 = [rng3.randint(100, 1000) for _ in range(100)]
+    v3 = [w + 100 for w in w3]
+    result = solve_knapsack_anytime(w3, v3, sum(w3) // 2, time_limit=1)
+    expected, _, _ = solve_knapsack(w3, v3, sum(w3) // 2)
+    assert result.value == expected and result.optimal, f"Test 3 Failed: {result}"
+
+    # Test 4: for large n a budget below the greedy floor is refused, and at
+    # the floor the pure-Python phases (which would overrun) are skipped
+    w4 = [rng.randint(10**5, 10**6) for _ in range(300000)]
+    v4 = [w + rng.randint(0, 10**5) for w in w4]
+    try:
+        solve_knapsack_anytime(w4, v4, sum(w4) // 2, time_limit=0.05)
+        assert False, "Test 4 Failed: no ValueError"
+    except ValueError:
+        pass
+    result = solve_knapsack_anytime(w4, v4, sum(w4) // 2, time_limit=min_time_limit(len(w4)))
+    assert result.phase == 'greedy', f"Test 4 Failed: ran {result.phase}"
+    assert result.value == sum(v4[i] for i in result.selected_items) <= result.upper_bound
+    assert sum(w4[i] for i in result.selected_items) <= sum(w4) // 2
+
+    # greedy_and_bound matches the pure-Python greedy and bound
+    for _ in range(200):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(-3, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        value, items, upper = greedy_and_bound(w, v, capacity)
+        assert (value, items) == greedy_by_ratio(w, v, capacity) and upper == dantzig_bound(w, v, capacity)
+
+    # Values whose sum overflows int64, or that do not fit in it at all,
+    # take the pure-Python greedy and bound
+    result = solve_knapsack_anytime([1] * 4, [2**62] * 4, 4)
+    assert result.value == result.upper_bound == 2**64 and result.optimal, f"Overflow Failed: {result}"
+    assert greedy_and_bound([1, 2], [2**70, 5], 2) == (2**70, [0], dantzig_bound([1, 2], [2**70, 5], 2))
+    result = solve_knapsack_anytime([3, 4, 5, 2], [2**63, 2**64, 3 * 2**62, 1], 7, time_limit=5)
+    assert result.value == 2**64 + 2**63 and result.optimal, f"Overflow Failed: {result}"
+
+    # Random cases: with enough time the answer is optimal
+    for _ in range(100):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        result = solve_knapsack_anytime(w, v, capacity, time_limit=5)
+        assert result.value == expected and result.upper_bound == expected, f"Expected {expected}, got {result}"
+        assert sum(w[i] for i in result.selected_items) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,136 @@
+"""
+Bit-packed decision table for the 0/1 Knapsack Problem.
+
+Instead of keeping every value cell of the (n+1)x(W+1) table, record one
+take/skip bit per (item, capacity) while filling a single rolling value row.
+The selected items are reconstructed from the bits alone, so a
+reconstruction-enabled solve needs about n * W / 8 bytes instead of
+n * W Python int objects.
+"""
+
+import numpy as np
+
+from ks_vectorized import apply_item_with_decision, check_dtype
+
+
+def fill_decisions(weights, values, capacity, dtype=np.int64):
+    """
+    Fill the rolling value row and record the take/skip bits.
+
+    Time Complexity: O(n * W) vectorized operations
+    Space Complexity: O(n * W / 8) bytes for the bits plus O(W) for the row
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the value row
+
+    Returns:
+        tuple: (row, bits) where row[w] is the best value for capacity w and
+        bits is a uint8 array of shape (n, ceil((W+1)/8)); bit w of bits[i]
+        is set when item i is taken in dp[i+1][w]
+    """
+    dtype = check_dtype(values, dtype)
+    n = len(weights)
+    row = np.zeros(capacity + 1, dtype=dtype)
+    bits = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+    for i in range(n):
+        take = apply_item_with_decision(row, weights[i], values[i])
+        bits[i] = np.packbits(take)
+    return row, bits
+
+
+def is_taken(bits, i, w):
+    """
+    Read the decision bit for item i at capacity w.
+
+    Args:
+        bits: Packed decision table from fill_decisions
+        i: Item index (0-based)
+        w: Capacity
+
+    Returns:
+        True if item i is taken in dp[i+1][w]
+    """
+    return bool((bits[i, w >> 3] >> (7 - (w & 7))) & 1)
+
+
+def backtrack_bits(bits, weights, capacity, n=None):
+    """
+    Backtrack through the packed decisions to find which items were selected.
+
+    Args:
+        bits: Packed decision table from fill_decisions
+        weights: List of item weights
+        capacity: Capacity to reconstruct the selection for
+        n: Number of leading items to consider (defaults to all rows of bits)
+
+    Returns:
+        List of selected item indices (0-based)
+    """
+    if n is None:
+        n = len(bits)
+    selected_items = []
+    w = capacity
+    for i in range(n - 1, -1, -1):
+        if is_taken(bits, i, w):
+            selected_items.append(i)
+            w -= weights[i]
+    selected_items.reverse()
+    return selected_items
+
+
+def solve_knapsack_bitset(weights, values, capacity, dtype=np.int64):
+    """
+    Solve 0/1 knapsack with reconstruction from a bit-packed decision table.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the value row
+
+    Returns:
+        tuple: (max_value, selected_items)
+    """
+    row, bits = fill_decisions(weights, values, capacity, dtype=dtype)
+    selected_items = backtrack_bits(bits, weights, capacity)
+    return int(row[capacity]), selected_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: choose best combination (not all fit)
+    max_value, selected = solve_knapsack_bitset([4, 2, 3], [10, 4, 7], 5)
+    assert max_value == 11 and selected == [1, 2], f"Test 1 Failed: got {max_value}, {selected}"
+
+    # Test 2: bits agree with the value table cell by cell
+    w2 = [2, 3, 4, 5, 6]
+    v2 = [3, 4, 8, 8, 10]
+    _, _, dp_table = solve_knapsack(w2, v2, 10)
+    _, bits2 = fill_decisions(w2, v2, 10)
+    for i in range(len(w2)):
+        for w in range(11):
+            assert is_taken(bits2, i, w) == (dp_table[i + 1][w] != dp_table[i][w])
+
+    # Random cases against the full table
+    rng = random.Random(3)
+    for _ in range(100):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        max_value, selected = solve_knapsack_bitset(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(v[i] for i in selected) == expected
+        assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
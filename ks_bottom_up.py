@@ -1,5 +1,11 @@
+from ks_bitset import solve_knapsack_bitset
+from ks_branch_bound import solve_knapsack_branch_bound
+from ks_hirschberg import solve_knapsack_hirschberg
+from ks_pareto import solve_knapsack_pareto
+from ks_value_dp import solve_knapsack_by_value
 
-def knapsack_bottom_up(n, capacity, weights, values):
+
+def knapsack_bottom_up(n, capacity, weights, values, stats=None):
     """
     Bottom-up dynamic programming solution for 0/1 Knapsack Problem.
     
@@ -11,10 +17,14 @@ def knapsack_bottom_up(n, capacity, weights, values):
         capacity: Maximum weight capacity of knapsack
         weights: List of item weights
         values: List of item values
+        stats: Optional instrumentation.SolveStats filled in place
     
     Returns:
         Maximum value that can be achieved
     """
+    if stats is not None:
+        stats.start('fill')
+
     # Create DP table: dp[i][w] = max value using first i items with capacity w
     dp_table = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
     
@@ -29,6 +39,11 @@ def knapsack_bottom_up(n, capacity, weights, values):
                 value_with_item = dp_table[i-1][w - weights[i-1]] + values[i-1]
                 dp_table[i][w] = max(dp_table[i][w], value_with_item)
     
+    if stats is not None:
+        stats.stop('fill')
+        stats.states_computed += n * (capacity + 1)
+        stats.space = (n + 1) * (capacity + 1)
+
     return dp_table[n][capacity]
 
 
@@ -61,7 +76,18 @@ def backtrack_solution(n, capacity, weights, values, dp_table):
     return selected_items
 
 
-def solve_knapsack(weights, values, capacity):
+# Engines that reconstruct the selected items without keeping dp_table.
+# Each one takes (weights, values, capacity) and returns (max_value, selected_items).
+ENGINES = {
+    "hirschberg": solve_knapsack_hirschberg,
+    "bitset": solve_knapsack_bitset,
+    "pareto": solve_knapsack_pareto,
+    "branch_bound": solve_knapsack_branch_bound,
+    "by_value": solve_knapsack_by_value,
+}
+
+
+def solve_knapsack(weights, values, capacity, engine="table", stats=None, on_row=None):
     """
     Complete solution with both max value and selected items.
     
@@ -69,11 +95,31 @@ def solve_knapsack(weights, values, capacity):
         weights: List of item weights
         values: List of item values
         capacity: Maximum weight capacity
+        engine: "table" (default) fills and returns the full DP table, which
+            KnapsackVisualizer needs. Any key of ENGINES solves without
+            the table and returns None in its place.
+        stats: Optional instrumentation.SolveStats filled in place
+            ('fill' and 'reconstruct' phases for the table engine, a single
+            'solve' phase for the others)
+        on_row: Optional callable(i, row) called after row i of the table is
+            filled (table engine only), e.g. to record an animation
     
     Returns:
         tuple: (max_value, selected_items, dp_table)
     """
+    if engine != "table":
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected 'table' or one of {sorted(ENGINES)}")
+        if stats is not None:
+            stats.start('solve')
+        max_value, selected_items = ENGINES[engine](weights, values, capacity)
+        if stats is not None:
+            stats.stop('solve')
+        return max_value, selected_items, None
+
     n = len(weights)
+    if stats is not None:
+        stats.start('fill')
     
     # Create DP table
     dp_table = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
@@ -86,10 +132,22 @@ def solve_knapsack(weights, values, capacity):
             if weights[i-1] <= w:
                 value_with_item = dp_table[i-1][w - weights[i-1]] + values[i-1]
                 dp_table[i][w] = max(dp_table[i][w], value_with_item)
-    
+
+        if on_row is not None:
+            on_row(i, dp_table[i])
+    
+    if stats is not None:
+        stats.stop('fill')
+        stats.states_computed += n * (capacity + 1)
+        stats.space = (n + 1) * (capacity + 1)
+        stats.start('reconstruct')
+
     # Backtrack to find selected items
     selected_items = backtrack_solution(n, capacity, weights, values, dp_table)
     max_value = dp_table[n][capacity]
+
+    if stats is not None:
+        stats.stop('reconstruct')
     
     return max_value, selected_items, dp_table
 
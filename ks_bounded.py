@@ -0,0 +1,157 @@
+"""
+Bounded and unbounded knapsack variants.
+
+In the bounded variant item i may be taken up to counts[i] times, and in the
+unbounded variant any number of times. Repeating an item k times in the
+weights/values lists would make n grow with k. Instead each item is split
+into binary chunks of 1, 2, 4, ... copies plus a remainder, and every
+quantity from 0 to k is a sum of a subset of the chunks. The chunks are
+solved as ordinary 0/1 items with the vectorized, bit-packed engine, so the
+cost is O(W * sum(log k)) rather than O(W * sum(k)). The unbounded variant
+is the bounded one with counts[i] = W // weights[i], the most that can ever
+fit.
+
+Both return the quantity taken of each original item instead of a list of
+indices; KnapsackVisualizer.visualize_solution accepts it as quantities=.
+"""
+
+import numpy as np
+
+from ks_bitset import backtrack_bits, fill_decisions
+
+
+def split_counts(weights, values, counts, capacity):
+    """
+    Binary splitting of item copies into 0/1 chunks.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        counts: Copies available of each item
+        capacity: Maximum weight capacity (no more copies than fit are used)
+
+    Returns:
+        tuple: (chunk_weights, chunk_values, chunk_items, chunk_sizes) where
+        chunk j stands for chunk_sizes[j] copies of item chunk_items[j]
+    """
+    chunk_weights, chunk_values, chunk_items, chunk_sizes = [], [], [], []
+    for i, (w, v, k) in enumerate(zip(weights, values, counts)):
+        if k < 0:
+            raise ValueError(f"count of item {i} is negative: {k}")
+        if v <= 0 or w > capacity:
+            continue
+        if w > 0:
+            k = min(k, capacity // w)
+        size = 1
+        while k > 0:
+            # zero-weight copies are all worth taking: one chunk for the lot
+            take = k if w == 0 else min(size, k)
+            chunk_weights.append(w * take)
+            chunk_values.append(v * take)
+            chunk_items.append(i)
+            chunk_sizes.append(take)
+            k -= take
+            size *= 2
+    return chunk_weights, chunk_values, chunk_items, chunk_sizes
+
+
+def solve_knapsack_bounded(weights, values, counts, capacity, dtype=np.int64):
+    """
+    Solve the bounded knapsack, where item i can be taken up to counts[i] times.
+
+    Time Complexity: O(W * sum(log counts[i])) vectorized operations
+    Space Complexity: O(W * sum(log counts[i]) / 8) bytes of decision bits
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        counts: Copies available of each item
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the value row
+
+    Returns:
+        tuple: (max_value, quantities) where quantities[i] is how many
+        copies of item i are taken
+    """
+    chunk_weights, chunk_values, chunk_items, chunk_sizes = split_counts(weights, values, counts, capacity)
+    row, bits = fill_decisions(chunk_weights, chunk_values, capacity, dtype=dtype)
+    quantities = [0] * len(weights)
+    for j in backtrack_bits(bits, chunk_weights, capacity):
+        quantities[chunk_items[j]] += chunk_sizes[j]
+    return int(row[capacity]), quantities
+
+
+def solve_knapsack_unbounded(weights, values, capacity, dtype=np.int64):
+    """
+    Solve the unbounded knapsack, where every item can be taken any number of times.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the value row
+
+    Returns:
+        tuple: (max_value, quantities) where quantities[i] is how many
+        copies of item i are taken
+
+    Raises:
+        ValueError: If an item with zero weight has positive value, which
+            makes the optimum unbounded
+    """
+    counts = []
+    for i, (w, v) in enumerate(zip(weights, values)):
+        if w == 0 and v > 0:
+            raise ValueError(f"item {i} has zero weight and positive value; the optimum is unbounded")
+        counts.append(capacity // w if w > 0 else 0)
+    return solve_knapsack_bounded(weights, values, counts, capacity, dtype=dtype)
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: two copies of the best item
+    max_value, quantities = solve_knapsack_bounded([4, 2, 3], [10, 4, 7], [2, 1, 1], 8)
+    assert max_value == 20 and quantities == [2, 0, 0], f"Test 1 Failed: got {max_value}, {quantities}"
+
+    # Test 2: unbounded, classic coin-like instance
+    max_value, quantities = solve_knapsack_unbounded([5, 10, 15], [10, 30, 20], 100)
+    assert max_value == 300 and quantities == [0, 10, 0], f"Test 2 Failed: got {max_value}, {quantities}"
+
+    # Test 3: huge counts stay cheap (about log2(10**9) chunks per item)
+    max_value, quantities = solve_knapsack_bounded([3, 7], [4, 10], [10**9, 10**9], 10**5)
+    assert sum(q * w for q, w in zip(quantities, [3, 7])) <= 10**5
+    assert max_value == sum(q * v for q, v in zip(quantities, [4, 10]))
+
+    # Random cases against the 0/1 table on expanded copies
+    rng = random.Random(19)
+    for _ in range(200):
+        n = rng.randint(0, 6)
+        w = [rng.randint(0, 10) for _ in range(n)]
+        v = [rng.randint(0, 20) for _ in range(n)]
+        counts = [rng.randint(0, 5) for _ in range(n)]
+        capacity = rng.randint(0, 30)
+        expanded_w = [w[i] for i in range(n) for _ in range(counts[i])]
+        expanded_v = [v[i] for i in range(n) for _ in range(counts[i])]
+        expected, _, _ = solve_knapsack(expanded_w, expanded_v, capacity)
+
+        max_value, quantities = solve_knapsack_bounded(w, v, counts, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert all(0 <= q <= c for q, c in zip(quantities, counts))
+        assert sum(q * wi for q, wi in zip(quantities, w)) <= capacity
+        assert sum(q * vi for q, vi in zip(quantities, v)) == max_value
+
+        w = [max(wi, 1) for wi in w]
+        unbounded_w = [w[i] for i in range(n) for _ in range(capacity // w[i])]
+        unbounded_v = [v[i] for i in range(n) for _ in range(capacity // w[i])]
+        expected, _, _ = solve_knapsack(unbounded_w, unbounded_v, capacity)
+        max_value, quantities = solve_knapsack_unbounded(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(q * wi for q, wi in zip(quantities, w)) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
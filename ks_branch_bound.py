@@ -0,0 +1,234 @@
+"""
+Branch-and-bound solver for the 0/1 Knapsack Problem.
+
+Items are sorted by value/weight ratio and searched depth first with an
+explicit stack. Each node is bounded with the Dantzig fractional (LP)
+relaxation; nodes that cannot beat the incumbent are pruned. The incumbent
+starts from the greedy-by-ratio solution, so on most instances with large n
+and W almost the whole tree is cut off.
+"""
+
+import time
+from bisect import bisect_right
+from math import floor
+
+
+def _sorted_candidates(weights, values, capacity):
+    """
+    Split the items into always-taken, never-taken and ratio-sorted candidates.
+
+    Returns:
+        tuple: (forced_items, candidates) where forced_items are zero-weight
+        items with positive value and candidates is a list of item indices
+        sorted by value/weight ratio, best first
+    """
+    forced_items = []
+    candidates = []
+    for i, (w, v) in enumerate(zip(weights, values)):
+        if v <= 0 or w > capacity:
+            continue
+        if w == 0:
+            forced_items.append(i)
+        else:
+            candidates.append(i)
+    candidates.sort(key=lambda i: (-values[i] / weights[i], i))
+    return forced_items, candidates
+
+
+class _Bound:
+    """Dantzig upper bound over ratio-sorted items using prefix sums."""
+
+    def __init__(self, weights, values, order):
+        self.weights = [weights[i] for i in order]
+        self.values = [values[i] for i in order]
+        self.prefix_weights = [0]
+        self.prefix_values = [0]
+        for w, v in zip(self.weights, self.values):
+            self.prefix_weights.append(self.prefix_weights[-1] + w)
+            self.prefix_values.append(self.prefix_values[-1] + v)
+        self.integral = all(isinstance(v, int) for v in values)
+
+    def __call__(self, k, remaining):
+        """
+        Best fractional value obtainable from items k.. with the remaining capacity.
+
+        Returns:
+            tuple: (bound, complete) where complete is True when every item
+            from k on fits, i.e. the bound is achieved by taking them all
+        """
+        pw = self.prefix_weights
+        # items k..j-1 fit completely, item j (if any) only fractionally
+        j = bisect_right(pw, pw[k] + remaining, lo=k) - 1
+        bound = self.prefix_values[j] - self.prefix_values[k]
+        if j == len(self.weights):
+            return bound, True
+        bound += (remaining - (pw[j] - pw[k])) * self.values[j] / self.weights[j]
+        if self.integral:
+            bound = floor(bound)
+        return bound, False
+
+
+def greedy_by_ratio(weights, values, capacity):
+    """
+    Greedy incumbent: take items in value/weight order whenever they still fit.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+
+    Returns:
+        tuple: (value, selected_items)
+    """
+    forced_items, candidates = _sorted_candidates(weights, values, capacity)
+    selected_items = list(forced_items)
+    remaining = capacity
+    for i in candidates:
+        if weights[i] <= remaining:
+            selected_items.append(i)
+            remaining -= weights[i]
+    selected_items.sort()
+    return sum(values[i] for i in selected_items), selected_items
+
+
+def dantzig_bound(weights, values, capacity):
+    """
+    Upper bound on the optimum from the fractional (LP) relaxation.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+
+    Returns:
+        Value no 0/1 solution can exceed (rounded down for integer values)
+    """
+    forced_items, order = _sorted_candidates(weights, values, capacity)
+    upper, _ = _Bound(weights, values, order)(0, capacity)
+    return upper + sum(values[i] for i in forced_items)
+
+
+def solve_knapsack_branch_bound(weights, values, capacity, stats=None, deadline=None, on_improve=None):
+    """
+    Solve 0/1 knapsack exactly by depth-first branch and bound.
+
+    Time Complexity: O(2^n) worst case, usually a tiny fraction of that
+    Space Complexity: O(n) for the search stack
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        stats: Optional dict (or instrumentation.SolveStats) that receives
+            'nodes_explored' and 'nodes_pruned', and with a deadline also
+            'timed_out' and 'upper_bound' (the best value any unexplored
+            node could still reach)
+        deadline: Optional time.perf_counter() value at which to stop and
+            return the best solution found so far
+        on_improve: Optional callable(value, selected_items) called every
+            time a better solution is found
+
+    Returns:
+        tuple: (max_value, selected_items), optimal unless the deadline hit
+    """
+    forced_items, order = _sorted_candidates(weights, values, capacity)
+    bound = _Bound(weights, values, order)
+    m = len(order)
+    item_weights = bound.weights
+    item_values = bound.values
+
+    best_value, best_items = greedy_by_ratio(weights, values, capacity)
+    forced_value = sum(values[i] for i in forced_items)
+    best_value -= forced_value
+    best_chosen = None
+    nodes_explored = 0
+    nodes_pruned = 0
+    timed_out = False
+
+    def selection(best_chosen):
+        chosen, tail_start = best_chosen
+        positions = list(range(tail_start, m))
+        while chosen is not None:
+            positions.append(chosen[0])
+            chosen = chosen[1]
+        return sorted(forced_items + [order[p] for p in positions])
+
+    # Each node: (next sorted position, remaining capacity, value so far,
+    # chosen positions as a linked list of (position, parent))
+    stack = [(0, capacity, 0, None)]
+    while stack:
+        if deadline is not None and nodes_explored % 1024 == 0 and time.perf_counter() >= deadline:
+            timed_out = True
+            break
+        k, remaining, value, chosen = stack.pop()
+        nodes_explored += 1
+
+        upper, complete = bound(k, remaining)
+        if complete:
+            # every remaining item fits: the bound is a feasible solution
+            if value + upper > best_value:
+                best_value = value + upper
+                best_chosen = (chosen, k)
+                if on_improve is not None:
+                    on_improve(best_value + forced_value, selection(best_chosen))
+            continue
+        if value + upper <= best_value:
+            nodes_pruned += 1
+            continue
+
+        # exclude item k, then include it (explored first)
+        stack.append((k + 1, remaining, value, chosen))
+        if item_weights[k] <= remaining:
+            stack.append((k + 1, remaining - item_weights[k], value + item_values[k], (k, chosen)))
+
+    if best_chosen is not None:
+        best_items = selection(best_chosen)
+
+    if stats is not None:
+        stats['nodes_explored'] = nodes_explored
+        stats['nodes_pruned'] = nodes_pruned
+        if deadline is not None:
+            open_bound = max((value + bound(k, remaining)[0] for k, remaining, value, _ in stack), default=0)
+            stats['timed_out'] = timed_out
+            stats['upper_bound'] = max(best_value, open_bound) + forced_value
+
+    return sum(values[i] for i in best_items), best_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: choose best combination (not all fit)
+    max_value, selected = solve_knapsack_branch_bound([4, 2, 3], [10, 4, 7], 5)
+    assert max_value == 11 and selected == [1, 2], f"Test 1 Failed: got {max_value}, {selected}"
+
+    # Test 2: greedy is not optimal here
+    max_value, selected = solve_knapsack_branch_bound([5, 4, 3], [10, 7, 5], 7)
+    assert max_value == 12 and selected == [1, 2], f"Test 2 Failed: got {max_value}, {selected}"
+
+    # Test 3: large instance, counters are reported
+    rng = random.Random(5)
+    w3 = [rng.randint(1, 10**6) for _ in range(2000)]
+    v3 = [rng.randint(1, 10**6) for _ in range(2000)]
+    stats = {}
+    max_value, selected = solve_knapsack_branch_bound(w3, v3, 10**8, stats=stats)
+    assert sum(w3[i] for i in selected) <= 10**8
+    assert stats['nodes_explored'] >= 1 and stats['nodes_pruned'] >= 0
+
+    # Random cases against the full table
+    for _ in range(200):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        max_value, selected = solve_knapsack_branch_bound(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,307 @@
+"""
+Persistent content-addressed result cache for the knapsack solvers.
+
+Results are keyed by a SHA-256 hash of the canonical (weights, values,
+capacity, engine) tuple. Lookups go through an in-process LRU tier first and
+then an optional sqlite tier on disk, which evicts its least recently used
+entries once it grows past a size limit.
+
+Besides exact results, the cache keeps the last DP row of an item set
+(row[w] = best value for capacity w). A value-only query for any capacity
+not above the stored one is answered from that row without solving.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from ks_bottom_up import solve_knapsack
+from ks_top_down import knapsack
+from ks_vectorized import knapsack_row
+
+
+def instance_key(weights, values, capacity=None, engine=None):
+    """
+    Canonical hash of an instance.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity (None for a key of the item set only)
+        engine: Engine name (None for a key of the item set only)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps([[int(w) for w in weights], [int(v) for v in values],
+                          None if capacity is None else int(capacity), engine],
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class KnapsackCache:
+    """
+    Two-tier (memory LRU + optional sqlite) cache in front of the solvers.
+    """
+
+    def __init__(self, max_entries=1024, path=None, max_disk_bytes=256 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in the in-process LRU tier
+            path: Optional sqlite database file for the persistent tier
+            max_disk_bytes: Size limit of the sqlite tier; least recently used
+                entries are evicted above it
+        """
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.row_hits = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS entries ("
+                             "key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                             "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self._db.commit()
+
+    # -- storage tiers -------------------------------------------------------
+
+    def _get(self, key):
+        """
+        Look a key up in both tiers without touching the hit counters.
+
+        Returns:
+            tuple: (value, tier) with tier 'memory' or 'disk', or (None, None)
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key], 'memory'
+        if self._db is not None:
+            found = self._db.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+            if found is not None:
+                self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._db.commit()
+                value = self._decode(found[0])
+                self._remember(key, value)
+                return value, 'disk'
+        return None, None
+
+    def _hit(self, tier):
+        """Count a request answered from the cache."""
+        self.hits += 1
+        if tier == 'memory':
+            self.memory_hits += 1
+        else:
+            self.disk_hits += 1
+
+    def _put(self, key, value):
+        self._remember(key, value)
+        if self._db is not None:
+            payload = self._encode(value)
+            self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                             (key, payload, len(payload), time.time()))
+            self._evict_disk()
+            self._db.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def _evict_disk(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        while total > self.max_disk_bytes:
+            oldest = self._db.execute("SELECT key, size FROM entries ORDER BY last_used LIMIT 1").fetchone()
+            if oldest is None:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (oldest[0],))
+            total -= oldest[1]
+            self.disk_evictions += 1
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, np.ndarray):
+            return b'R' + value.astype(np.int64).tobytes()
+        return b'J' + json.dumps(value).encode()
+
+    @staticmethod
+    def _decode(payload):
+        payload = bytes(payload)
+        if payload[:1] == b'R':
+            return np.frombuffer(payload[1:], dtype=np.int64)
+        return json.loads(payload[1:].decode())
+
+    # -- row reuse -----------------------------------------------------------
+
+    def _row_value(self, weights, values, capacity):
+        """
+        Answer a value-only query from a stored row.
+
+        Returns:
+            tuple: (max_value, tier), or (None, None) when no stored row covers capacity
+        """
+        row, tier = self._get('row:' + instance_key(weights, values))
+        if row is not None and capacity < len(row):
+            self.row_hits += 1
+            return int(row[capacity]), tier
+        return None, None
+
+    def _store_row(self, weights, values, row):
+        key = 'row:' + instance_key(weights, values)
+        old, _ = self._get(key)
+        if old is None or len(old) < len(row):
+            self._put(key, np.asarray(row, dtype=np.int64))
+
+    # -- cached solvers ------------------------------------------------------
+
+    def solve_knapsack(self, weights, values, capacity, engine="table"):
+        """
+        Cached solve_knapsack.
+
+        Returns:
+            tuple: (max_value, selected_items, None); the DP table is never
+            cached, call solve_knapsack directly when the visualizer needs it
+        """
+        key = instance_key(weights, values, capacity, 'solve:' + engine)
+        cached, tier = self._get(key)
+        if cached is not None:
+            self._hit(tier)
+            return cached[0], list(cached[1]), None
+
+        self.misses += 1
+        max_value, selected_items, dp_table = solve_knapsack(weights, values, capacity, engine=engine)
+        if dp_table is not None:
+            self._store_row(weights, values, dp_table[-1])
+        self._put(key, [max_value, selected_items])
+        return max_value, selected_items, None
+
+    def knapsack_bottom_up(self, n, capacity, weights, values):
+        """Cached knapsack_bottom_up (value only, same arguments)."""
+        weights, values = list(weights[:n]), list(values[:n])
+        max_value, tier = self._row_value(weights, values, capacity)
+        if max_value is not None:
+            self._hit(tier)
+            return max_value
+
+        self.misses += 1
+        # Same optimum as the list-of-lists table, and the row is worth keeping
+        row = knapsack_row(weights, values, capacity)
+        self._store_row(weights, values, row)
+        return int(row[capacity])
+
+    def knapsack(self, n, capacity, wts, vals):
+        """Cached ks_top_down.knapsack (value only, fresh memo per miss)."""
+        wts, vals = list(wts[:n]), list(vals[:n])
+        max_value, tier = self._row_value(wts, vals, capacity)
+        if max_value is None:
+            max_value, tier = self._get(instance_key(wts, vals, capacity, 'knapsack'))
+        if max_value is not None:
+            self._hit(tier)
+            return max_value
+
+        self.misses += 1
+        max_value = knapsack(n, capacity, wts, vals, {})
+        self._put(instance_key(wts, vals, capacity, 'knapsack'), max_value)
+        return max_value
+
+    def stats(self):
+        """Hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'row_hits': self.row_hits,
+            'memory_evictions': self.memory_evictions,
+            'disk_evictions': self.disk_evictions,
+            'memory_entries': len(self._memory),
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def test():
+    import os
+    import random
+    import tempfile
+
+    w = [2, 3, 4, 5, 6]
+    v = [3, 4, 8, 8, 10]
+
+    # Test 1: exact hits
+    cache = KnapsackCache()
+    assert cache.solve_knapsack(w, v, 10) == (18, [2, 4], None)
+    assert cache.solve_knapsack(w, v, 10) == (18, [2, 4], None)
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    assert cache.stats()['memory_hits'] == 1
+
+    # Internal lookups on a miss are not counted as tier hits
+    fresh = KnapsackCache()
+    for capacity in (4, 6, 8, 10):
+        fresh.solve_knapsack(w, v, capacity)
+    stats = fresh.stats()
+    assert (stats['hits'], stats['misses'], stats['memory_hits']) == (0, 4, 0), f"Test 1 Failed: {stats}"
+
+    # Test 2: the stored row answers any smaller capacity
+    for capacity in range(11):
+        assert cache.knapsack_bottom_up(len(w), capacity, w, v) == solve_knapsack(w, v, capacity)[0]
+        assert cache.knapsack(len(w), capacity, w, v) == solve_knapsack(w, v, capacity)[0]
+    stats = cache.stats()
+    assert stats['row_hits'] == 22 and stats['misses'] == 1
+    assert stats['hits'] == stats['memory_hits'] + stats['disk_hits'] == 23
+
+    # Test 3: a larger capacity misses and replaces the row
+    assert cache.knapsack_bottom_up(len(w), 15, w, v) == 26
+    assert cache.stats()['misses'] == 2
+
+    # Test 4: sqlite tier survives a restart and evicts by size
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        first = KnapsackCache(path=path)
+        first.solve_knapsack(w, v, 10, engine="bitset")
+        first.close()
+        second = KnapsackCache(path=path)
+        assert second.solve_knapsack(w, v, 10, engine="bitset") == (18, [2, 4], None)
+        assert second.stats()['disk_hits'] == 1
+        second.close()
+
+        small = KnapsackCache(path=os.path.join(tmp, 'small.sqlite'), max_disk_bytes=200)
+        rng = random.Random(17)
+        for _ in range(20):
+            small.knapsack_bottom_up(3, 50, [rng.randint(1, 9) for _ in range(3)], [1, 2, 3])
+        size = small._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        assert size <= 200 and small.stats()['disk_evictions'] > 0
+        assert small.stats()['memory_evictions'] == 0
+        small.close()
+
+    # Test 5: the memory tier counts its own evictions
+    tiny = KnapsackCache(max_entries=2)
+    for capacity in range(5):
+        tiny.solve_knapsack(w, v, capacity)
+    assert tiny.stats()['memory_evictions'] > 0 and tiny.stats()['disk_evictions'] == 0
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
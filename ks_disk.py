@@ -0,0 +1,274 @@
+"""
+Memory-mapped on-disk DP tables with checkpoint/resume.
+
+When the full table is needed (for backtracking or visualize_backtrack) but
+n * W does not fit in RAM, the rows are written to a numpy.memmap-backed file
+as they are computed. A small JSON checkpoint next to the file records how
+many rows are complete, so a killed job resumes from the last checkpoint
+instead of starting over. Reconstruction and the visualizer read rows back
+lazily through the memmap.
+
+Two formats are supported:
+
+- "values": the plain (n+1)x(W+1) value table in the chosen integer dtype,
+  usable anywhere a dp_table is expected
+- "bits": one take/skip bit per (item, capacity) as in ks_bitset, 64x
+  smaller than int64 values; the rolling value row is saved with every
+  checkpoint so the fill can resume
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from ks_bitset import is_taken
+from ks_vectorized import apply_item, apply_item_with_decision, check_dtype
+
+
+FORMATS = ('values', 'bits')
+
+
+def _fingerprint(weights, values, capacity, fmt, dtype):
+    payload = json.dumps([list(map(int, weights)), list(map(int, values)), int(capacity), fmt, dtype.str])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DiskTable:
+    """
+    DP table stored in a memory-mapped file, filled row by row.
+    """
+
+    def __init__(self, path, weights, values, capacity, fmt='values', dtype=np.int64):
+        """
+        Open the table at path, resuming from its checkpoint if it matches.
+
+        Args:
+            path: Data file path; the checkpoint is stored at path + '.json'
+                (and the rolling row at path + '.row.npy' for the bits format)
+            weights: List of item weights
+            values: List of item values
+            capacity: Maximum weight capacity
+            fmt: "values" or "bits"
+            dtype: NumPy integer dtype of the values
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+        self.path = path
+        self.checkpoint_path = path + '.json'
+        self.row_path = path + '.row.npy'
+        self.weights = list(weights)
+        self.values = list(values)
+        self.capacity = capacity
+        self.fmt = fmt
+        self.dtype = check_dtype(self.values, dtype)
+        self.n = len(self.weights)
+        self.fingerprint = _fingerprint(self.weights, self.values, capacity, fmt, self.dtype)
+
+        if fmt == 'values':
+            shape, file_dtype = (self.n + 1, capacity + 1), self.dtype
+        else:
+            shape, file_dtype = (self.n, (capacity + 8) // 8), np.dtype(np.uint8)
+
+        self.completed_rows = 0
+        resume = self._read_checkpoint()
+        if self.n == 0 and fmt == 'bits':
+            # numpy cannot map an empty file; there are no decisions to store
+            self.rows = np.zeros(shape, dtype=file_dtype)
+            self._write_checkpoint(np.zeros(capacity + 1, dtype=self.dtype))
+        elif resume is not None and os.path.exists(path):
+            self.completed_rows = resume
+            self.rows = np.memmap(path, dtype=file_dtype, mode='r+', shape=shape)
+        else:
+            self.rows = np.memmap(path, dtype=file_dtype, mode='w+', shape=shape)
+            self._write_checkpoint(np.zeros(capacity + 1, dtype=self.dtype))
+
+    def _read_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get('fingerprint') != self.fingerprint:
+            return None
+        if self.fmt == 'bits' and not os.path.exists(self.row_path):
+            return None
+        return checkpoint['completed_rows']
+
+    def _write_checkpoint(self, row):
+        # Data first, then the checkpoint that vouches for it (atomic rename)
+        if isinstance(self.rows, np.memmap):
+            self.rows.flush()
+        if self.fmt == 'bits':
+            tmp_row = self.row_path + '.tmp.npy'
+            np.save(tmp_row, row)
+            os.replace(tmp_row, self.row_path)
+        tmp = self.checkpoint_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'completed_rows': self.completed_rows,
+                       'n': self.n, 'capacity': self.capacity, 'fmt': self.fmt}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def _current_row(self):
+        """Rolling value row after completed_rows items."""
+        if self.fmt == 'values':
+            return np.array(self.rows[self.completed_rows])
+        return np.load(self.row_path)
+
+    @property
+    def complete(self):
+        return self.completed_rows == self.n
+
+    def fill(self, checkpoint_every=64, max_items=None):
+        """
+        Compute the remaining rows, checkpointing as it goes.
+
+        Args:
+            checkpoint_every: Items between checkpoints
+            max_items: Stop after this many items (None = until complete)
+
+        Returns:
+            True if the table is complete
+        """
+        row = self._current_row()
+        stop = self.n if max_items is None else min(self.n, self.completed_rows + max_items)
+        for i in range(self.completed_rows, stop):
+            if self.fmt == 'values':
+                apply_item(row, self.weights[i], self.values[i])
+                self.rows[i + 1] = row
+            else:
+                take = apply_item_with_decision(row, self.weights[i], self.values[i])
+                self.rows[i] = np.packbits(take)
+            self.completed_rows = i + 1
+            if self.completed_rows % checkpoint_every == 0 or self.completed_rows == stop:
+                self._write_checkpoint(row)
+        return self.complete
+
+    def max_value(self, capacity=None):
+        """Best value for the given capacity (defaults to the full one)."""
+        if not self.complete:
+            raise RuntimeError("table is not complete; call fill() first")
+        if capacity is None:
+            capacity = self.capacity
+        if self.fmt == 'values':
+            return int(self.rows[self.n, capacity])
+        return int(self._current_row()[capacity])
+
+    def backtrack(self, capacity=None):
+        """
+        Recover the selected items, reading one or two cells per row from disk.
+
+        Args:
+            capacity: Capacity to reconstruct (defaults to the full one)
+
+        Returns:
+            List of selected item indices (0-based)
+        """
+        if not self.complete:
+            raise RuntimeError("table is not complete; call fill() first")
+        w = self.capacity if capacity is None else capacity
+        selected_items = []
+        for i in range(self.n, 0, -1):
+            if self.fmt == 'values':
+                taken = self.rows[i, w] != self.rows[i - 1, w]
+            else:
+                taken = is_taken(self.rows, i - 1, w)
+            if taken:
+                selected_items.append(i - 1)
+                w -= self.weights[i - 1]
+        selected_items.reverse()
+        return selected_items
+
+    @property
+    def dp_table(self):
+        """Lazy (n+1)x(W+1) memmap for KnapsackVisualizer (values format only)."""
+        if self.fmt != 'values':
+            raise ValueError("the bits format stores decisions, not values")
+        return self.rows
+
+    def remove(self):
+        """Delete the data and checkpoint files."""
+        self.rows = None
+        for path in (self.path, self.checkpoint_path, self.row_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def solve_knapsack_disk(weights, values, capacity, path, fmt='values', dtype=np.int64,
+                        checkpoint_every=64):
+    """
+    Solve with the table on disk, resuming a previous run at the same path.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        path: Data file for the table
+        fmt: "values" (plain table) or "bits" (packed decisions)
+        dtype: NumPy integer dtype of the values
+        checkpoint_every: Items between checkpoints
+
+    Returns:
+        tuple: (max_value, selected_items, table) where table is the DiskTable;
+        pass table.dp_table to KnapsackVisualizer for the values format
+    """
+    table = DiskTable(path, weights, values, capacity, fmt=fmt, dtype=dtype)
+    table.fill(checkpoint_every=checkpoint_every)
+    return table.max_value(), table.backtrack(), table
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+    import tempfile
+
+    rng = random.Random(16)
+    w = [rng.randint(0, 20) for _ in range(40)]
+    v = [rng.randint(0, 50) for _ in range(40)]
+    capacity = 100
+    expected, expected_items, dp_table = solve_knapsack(w, v, capacity)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            path = os.path.join(tmp, f'table.{fmt}')
+
+            # Test 1: a job killed after 15 items resumes from its checkpoint
+            first = DiskTable(path, w, v, capacity, fmt=fmt)
+            assert not first.fill(checkpoint_every=5, max_items=15)
+            first.rows.flush()
+            del first
+
+            resumed = DiskTable(path, w, v, capacity, fmt=fmt)
+            assert resumed.completed_rows == 15, f"Test 1 Failed: resumed at {resumed.completed_rows}"
+            assert resumed.fill(checkpoint_every=5)
+            assert resumed.max_value() == expected
+            assert resumed.backtrack() == expected_items
+            if fmt == 'values':
+                assert np.array_equal(resumed.dp_table, np.array(dp_table))
+            resumed.remove()
+
+            # Test 2: a different instance at the same path starts over
+            max_value, selected, table = solve_knapsack_disk(w, v, capacity - 1, path, fmt=fmt)
+            assert max_value == solve_knapsack(w, v, capacity - 1)[0]
+            table.remove()
+
+        # Test 3: the visualizer pools a large memmap band by band
+        import tracemalloc
+        from visualization import KnapsackVisualizer
+
+        big = DiskTable(os.path.join(tmp, 'big.values'), [1] * 1000, [1] * 1000, 9999)
+        big.rows[:] = np.arange(10000)
+        tracemalloc.start()
+        pooled, _ = KnapsackVisualizer(big.weights, big.values, big.capacity)._max_pool(big.dp_table)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < big.rows.nbytes // 20, f"Test 3 Failed: peak {peak} for a {big.rows.nbytes}-byte table"
+        assert pooled.shape == (334, 1000) and pooled[0, -1] == 9999
+        big.remove()
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
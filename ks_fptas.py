@@ -0,0 +1,109 @@
+"""
+FPTAS (fully polynomial-time approximation scheme) for the 0/1 Knapsack Problem.
+
+The exact engines are pseudo-polynomial: their tables grow with W or with
+sum(values). Here the values are scaled down by K = epsilon * v_max / n and
+rounded down, and the value-indexed DP from ks_value_dp is run on the
+rounded values. The rounded total is at most n^2 / epsilon, so the run time
+is O(n^3 / epsilon) no matter how large the weights, the capacity or the
+values are, and the selection found is worth at least (1 - epsilon) of the
+optimum.
+
+Besides the solution, the solver returns a certified upper bound on the
+optimum, so callers can see how close the answer really is (usually much
+closer than epsilon).
+"""
+
+from math import floor
+
+from ks_bitset import backtrack_bits
+from ks_branch_bound import dantzig_bound
+from ks_value_dp import best_fitting_value, fill_min_weights
+
+
+def solve_knapsack_fptas(weights, values, capacity, epsilon=0.1):
+    """
+    Solve 0/1 knapsack to within a factor (1 - epsilon) of the optimum.
+
+    Time Complexity: O(n^3 / epsilon) vectorized operations in the worst case
+    Space Complexity: O(n^3 / epsilon / 8) bytes of decision bits
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        epsilon: Allowed relative loss, 0 < epsilon < 1
+
+    Returns:
+        tuple: (value, selected_items, upper_bound) where value is the worth
+        of selected_items and value <= optimum <= upper_bound
+
+    Raises:
+        ValueError: If epsilon is not in (0, 1)
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon must be in (0, 1), got {epsilon}")
+
+    usable = [i for i, (w, v) in enumerate(zip(weights, values)) if v > 0 and w <= capacity]
+    if not usable:
+        return 0, [], 0
+    v_max = max(values[i] for i in usable)
+    integral = all(isinstance(values[i], int) for i in usable)
+    scale = epsilon * v_max / len(usable)
+    if integral and scale <= 1:
+        # rounding would not shrink the table: solve exactly
+        scale = 1
+
+    scaled = [0] * len(values)
+    for i in usable:
+        scaled[i] = floor(values[i] / scale)
+    row, bits = fill_min_weights(weights, scaled, capacity)
+    best_scaled = best_fitting_value(row, capacity)
+    selected_items = backtrack_bits(bits, scaled, best_scaled)
+    value = sum(values[i] for i in selected_items)
+
+    if integral and scale == 1:
+        return value, selected_items, value
+    # Any feasible set S has value < scale * (rounded value of S + |S|), and its
+    # rounded value is at most best_scaled; the LP relaxation is a second bound
+    upper_bound = min(dantzig_bound(weights, values, capacity), scale * (best_scaled + len(usable)))
+    if integral:
+        upper_bound = floor(upper_bound)
+    return value, selected_items, max(upper_bound, value)
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: small values are solved exactly (the scale is clamped at 1)
+    value, selected, upper = solve_knapsack_fptas([4, 2, 3], [10, 4, 7], 5)
+    assert value == 11 and selected == [1, 2] and upper >= 11, f"Test 1 Failed: got {value}, {selected}, {upper}"
+
+    # Test 2: huge values and weights, still fast, guarantee holds
+    rng = random.Random(22)
+    w2 = [rng.randint(1, 10**9) for _ in range(200)]
+    v2 = [rng.randint(1, 10**12) for _ in range(200)]
+    capacity2 = sum(w2) // 3
+    value, selected, upper = solve_knapsack_fptas(w2, v2, capacity2, epsilon=0.05)
+    assert sum(w2[i] for i in selected) <= capacity2
+    assert value == sum(v2[i] for i in selected) and value >= (1 - 0.05) * upper, f"Test 2 Failed: {value} / {upper}"
+
+    # Random cases against the full table
+    for _ in range(200):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 1000) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        epsilon = rng.choice([0.5, 0.2, 0.05])
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        value, selected, upper = solve_knapsack_fptas(w, v, capacity, epsilon)
+        assert value >= (1 - epsilon) * expected, f"Expected at least {(1 - epsilon) * expected}, got {value}"
+        assert value <= expected <= upper, f"Bound broken: {value} <= {expected} <= {upper}"
+        assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
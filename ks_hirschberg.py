@@ -0,0 +1,97 @@
+"""
+Linear-memory item reconstruction for the 0/1 Knapsack Problem.
+
+Hirschberg-style divide and conquer: split the item list in half, compute
+the last DP row of each half (one forwards, one over the second half), pick
+the capacity split that maximizes their sum, then recurse on both halves.
+Only O(W) rows are alive at any time instead of the full (n+1)x(W+1) table.
+"""
+
+import numpy as np
+
+from ks_vectorized import knapsack_row
+
+
+def _split_solve(weights, values, lo, hi, capacity, selected, dtype):
+    """
+    Append the optimal selection of items[lo:hi] for the given capacity.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        lo: First item index of the sub-list
+        hi: One past the last item index of the sub-list
+        capacity: Capacity available to this sub-list
+        selected: Output list the chosen item indices are appended to
+        dtype: NumPy integer dtype for the rows
+    """
+    if hi - lo == 1:
+        if weights[lo] <= capacity and values[lo] > 0:
+            selected.append(lo)
+        return
+
+    mid = (lo + hi) // 2
+    left = knapsack_row(weights[lo:mid], values[lo:mid], capacity, dtype=dtype)
+    right = knapsack_row(weights[mid:hi], values[mid:hi], capacity, dtype=dtype)
+
+    # Best split: left half gets c, right half gets capacity - c
+    split = int(np.argmax(left + right[::-1]))
+    del left, right
+
+    _split_solve(weights, values, lo, mid, split, selected, dtype)
+    _split_solve(weights, values, mid, hi, capacity - split, selected, dtype)
+
+
+def solve_knapsack_hirschberg(weights, values, capacity, dtype=np.int64):
+    """
+    Solve 0/1 knapsack and recover the selected items without the DP table.
+
+    Time Complexity: O(n * W * log n)
+    Space Complexity: O(W) for the rows plus O(log n) recursion depth
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the rows
+
+    Returns:
+        tuple: (max_value, selected_items)
+    """
+    n = len(weights)
+    selected_items = []
+    if n > 0:
+        _split_solve(weights, values, 0, n, capacity, selected_items, dtype)
+    max_value = sum(values[i] for i in selected_items)
+    return max_value, selected_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: choose best combination (not all fit)
+    max_value, selected = solve_knapsack_hirschberg([4, 2, 3], [10, 4, 7], 5)
+    assert max_value == 11 and selected == [1, 2], f"Test 1 Failed: got {max_value}, {selected}"
+
+    # Test 2: no items
+    assert solve_knapsack_hirschberg([], [], 10) == (0, [])
+
+    # Random cases against the full table
+    rng = random.Random(1)
+    for _ in range(100):
+        n = rng.randint(1, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        max_value, selected = solve_knapsack_hirschberg(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(w[i] for i in selected) <= capacity
+        assert selected == sorted(set(selected))
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,191 @@
+"""
+Incremental 0/1 knapsack solver for item sets that keep growing.
+
+The solver keeps the bottom-up DP rows between calls. Adding an item costs one
+O(W) vectorized row update, and growing the capacity only computes the new
+columns of every row, instead of re-solving the whole table from scratch.
+"""
+
+import numpy as np
+
+from ks_vectorized import apply_item, check_dtype
+
+
+class IncrementalKnapsack:
+    """
+    Stateful knapsack solver supporting streamed items and capacity growth.
+    """
+
+    def __init__(self, capacity, dtype=np.int64):
+        """
+        Initialize an empty solver.
+
+        Args:
+            capacity: Initial maximum weight capacity
+            dtype: NumPy integer dtype used for the DP rows
+        """
+        self.capacity = capacity
+        self.weights = []
+        self.values = []
+        self.dtype = check_dtype([], dtype)
+        # Sum of the positive values so far, the largest value a row can hold
+        self._positive_sum = 0
+        # Rows and columns are over-allocated and doubled when full, so
+        # add_item and extend_capacity are amortized O(W) and O(n * delta W)
+        self._table = np.zeros((16, capacity + 1), dtype=self.dtype)
+
+    @property
+    def n(self):
+        """Number of items added so far."""
+        return len(self.weights)
+
+    @property
+    def dp_table(self):
+        """View of the (n+1)x(W+1) DP table, usable with KnapsackVisualizer."""
+        return self._table[:self.n + 1, :self.capacity + 1]
+
+    def _grow(self, rows, cols):
+        old_rows, old_cols = self._table.shape
+        if rows <= old_rows and cols <= old_cols:
+            return
+        new_rows = max(rows, old_rows * 2) if rows > old_rows else old_rows
+        new_cols = max(cols, old_cols * 2) if cols > old_cols else old_cols
+        table = np.zeros((new_rows, new_cols), dtype=self.dtype)
+        table[:self.n + 1, :self.capacity + 1] = self.dp_table
+        self._table = table
+
+    def add_item(self, weight, value):
+        """
+        Add one item and compute its DP row.
+
+        Time Complexity: O(W) amortized
+
+        Args:
+            weight: Item weight
+            value: Item value
+        """
+        check_dtype([self._positive_sum, value], self.dtype)
+        n = self.n
+        self._grow(n + 2, self.capacity + 1)
+        row = self._table[n + 1, :self.capacity + 1]
+        row[:] = self._table[n, :self.capacity + 1]
+        apply_item(row, weight, value)
+        self.weights.append(weight)
+        self.values.append(value)
+        self._positive_sum += max(value, 0)
+
+    def extend_capacity(self, new_capacity):
+        """
+        Grow the capacity, computing only the new columns of each row.
+
+        Time Complexity: O(n * (new_capacity - capacity)) amortized
+
+        Args:
+            new_capacity: New maximum weight capacity (not below the current one)
+        """
+        if new_capacity < self.capacity:
+            raise ValueError(f"new_capacity {new_capacity} is below the current capacity {self.capacity}")
+        lo, hi = self.capacity + 1, new_capacity + 1
+        self._grow(self.n + 1, hi)
+        table = self._table
+        table[0, lo:hi] = 0
+        for i in range(1, self.n + 1):
+            weight, value = self.weights[i - 1], self.values[i - 1]
+            # Option 1: Don't include item i-1
+            table[i, lo:hi] = table[i - 1, lo:hi]
+            # Option 2: Include item i-1 where it fits
+            start = max(lo, weight)
+            if value > 0 and start < hi:
+                np.maximum(table[i, start:hi], table[i - 1, start - weight:hi - weight] + value,
+                           out=table[i, start:hi])
+        self.capacity = new_capacity
+
+    def best_value(self, capacity=None):
+        """
+        Best value with the items added so far.
+
+        Args:
+            capacity: Optional smaller capacity to query (defaults to the full one)
+
+        Returns:
+            Maximum value that can be achieved
+        """
+        if capacity is None:
+            capacity = self.capacity
+        return int(self._table[self.n, min(capacity, self.capacity)])
+
+    def selection(self, capacity=None):
+        """
+        Items selected by an optimal solution with the items added so far.
+
+        Args:
+            capacity: Optional smaller capacity to query (defaults to the full one)
+
+        Returns:
+            List of selected item indices (0-based)
+        """
+        if capacity is None:
+            capacity = self.capacity
+        table = self._table
+        selected_items = []
+        w = min(capacity, self.capacity)
+        for i in range(self.n, 0, -1):
+            if table[i, w] != table[i - 1, w]:
+                selected_items.append(i - 1)
+                w -= self.weights[i - 1]
+        selected_items.reverse()
+        return selected_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: items streamed one by one
+    solver = IncrementalKnapsack(5)
+    for w, v in zip([4, 2, 3], [10, 4, 7]):
+        solver.add_item(w, v)
+    assert solver.best_value() == 11 and solver.selection() == [1, 2]
+
+    # Test 2: capacity growth matches a full re-solve
+    solver.extend_capacity(9)
+    assert solver.best_value() == 21 and solver.selection() == [0, 1, 2]
+    expected, _, dp_table = solve_knapsack([4, 2, 3], [10, 4, 7], 9)
+    assert solver.dp_table.tolist() == dp_table
+
+    # Test 3: overflow is caught from the running sum
+    solver = IncrementalKnapsack(10, dtype=np.int8)
+    for _ in range(3):
+        solver.add_item(1, 40)
+    solver.add_item(1, -5)
+    try:
+        solver.add_item(1, 8)
+        assert False, "Test 3 Failed: expected ValueError"
+    except ValueError:
+        pass
+    assert solver.n == 4
+
+    # Random interleavings against the full table
+    rng = random.Random(9)
+    for _ in range(50):
+        solver = IncrementalKnapsack(rng.randint(0, 10))
+        w, v = [], []
+        for _ in range(rng.randint(0, 40)):
+            if rng.random() < 0.7:
+                w.append(rng.randint(0, 15))
+                v.append(rng.randint(0, 30))
+                solver.add_item(w[-1], v[-1])
+            else:
+                solver.extend_capacity(solver.capacity + rng.randint(0, 20))
+            expected, _, dp_table = solve_knapsack(w, v, solver.capacity)
+            assert solver.best_value() == expected
+            assert solver.dp_table.tolist() == dp_table
+            selected = solver.selection()
+            assert sum(v[i] for i in selected) == expected
+            assert sum(w[i] for i in selected) <= solver.capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,228 @@
+"""
+Streaming bulk instance loader.
+
+Reads knapsack instances from files far larger than memory and yields them
+one at a time as (instance_id, weights, values, capacity) with weights and
+values as int64 NumPy arrays. Parsing is done in blocks by C code
+(json.loads on a whole block of lines, np.loadtxt on a block of CSV rows,
+slices of a memory-mapped .npy), never value by value in Python.
+
+Formats:
+
+- JSONL: one instance per line,
+  {"id": ..., "weights": [...], "values": [...], "capacity": C}
+  ("id" is optional and defaults to the 0-based line number; blank lines
+  are skipped but still counted)
+- CSV: one item per row with the columns instance,weight,value,capacity;
+  the rows of one instance are contiguous and an optional header is skipped
+  (an instance without items has no rows, so use JSONL for those)
+- NPY: an int64 array of shape (rows, 4) with the same columns as the CSV,
+  opened with mmap so only the block being read is paged in
+"""
+
+import json
+import sys
+from itertools import islice
+
+import numpy as np
+
+
+FORMATS = ('jsonl', 'csv', 'npy')
+
+
+def detect_format(path):
+    """Guess the format from the file extension (stdin '-' is JSONL)."""
+    if path == '-' or path.endswith(('.jsonl', '.json', '.ndjson')):
+        return 'jsonl'
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith('.npy'):
+        return 'npy'
+    raise ValueError(f"Cannot tell the format of {path!r}, expected one of {FORMATS}")
+
+
+def _jsonl_blocks(f, chunk_bytes):
+    """Lists of raw lines holding about chunk_bytes each (at least one line)."""
+    block, size = [], 0
+    for line in f:
+        block.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield block
+            block, size = [], 0
+    if block:
+        yield block
+
+
+def _jsonl_instances(f, chunk_bytes):
+    line_number = 0
+    for block in _jsonl_blocks(f, chunk_bytes):
+        numbers = [line_number + k for k, line in enumerate(block) if line.strip()]
+        line_number += len(block)
+        if not numbers:
+            continue
+        # one parser call for the whole block
+        records = json.loads(b'[' + b','.join(line for line in block if line.strip()) + b']')
+        for number, record in zip(numbers, records):
+            yield (record.get('id', number), np.asarray(record['weights'], dtype=np.int64),
+                   np.asarray(record['values'], dtype=np.int64), int(record['capacity']))
+
+
+def _csv_blocks(f, chunk_rows):
+    first = f.readline()
+    if first and any(c.isalpha() for c in first):
+        first = None  # header
+    while True:
+        lines = list(islice(f, chunk_rows))
+        if first:
+            lines.insert(0, first)
+            first = None
+        if not lines:
+            return
+        yield np.loadtxt(lines, delimiter=',', dtype=np.int64, ndmin=2)
+
+
+def _npy_blocks(path, chunk_rows):
+    rows = np.load(path, mmap_mode='r')
+    if rows.ndim != 2 or rows.shape[1] != 4:
+        raise ValueError(f"{path} must hold an array of shape (rows, 4), got {rows.shape}")
+    for start in range(0, len(rows), chunk_rows):
+        yield np.asarray(rows[start:start + chunk_rows], dtype=np.int64)
+
+
+def _instance(parts):
+    rows = parts[0] if len(parts) == 1 else np.concatenate(parts)
+    return int(rows[0, 0]), rows[:, 1].copy(), rows[:, 2].copy(), int(rows[0, 3])
+
+
+def _group_rows(blocks):
+    """Split blocks of (instance, weight, value, capacity) rows into instances."""
+    # rows of the unfinished instance, concatenated once when it ends
+    carry = []
+    for block in blocks:
+        if not len(block):
+            continue
+        ids = block[:, 0]
+        starts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        if carry and carry[0][0, 0] != ids[0]:
+            yield _instance(carry)
+            carry = []
+        if not len(starts):
+            # the whole block continues the current instance
+            carry.append(block)
+            continue
+        carry.append(block[:starts[0]])
+        yield _instance(carry)
+        for start, end in zip(starts[:-1], starts[1:]):
+            yield _instance([block[start:end]])
+        # the last instance may continue in the next block
+        carry = [block[starts[-1]:]]
+    if carry:
+        yield _instance(carry)
+
+
+def iter_instances(path, fmt=None, chunk_rows=65536, chunk_bytes=4 * 1024 * 1024):
+    """
+    Stream instances from a JSONL, CSV or NPY file.
+
+    A JSONL line is a whole instance of any size, so JSONL is read in blocks
+    of about chunk_bytes; CSV and NPY rows are single items, so those are
+    read chunk_rows rows at a time.
+
+    Args:
+        path: File path ('-' reads JSONL from stdin)
+        fmt: "jsonl", "csv" or "npy" (defaults to the file extension)
+        chunk_rows: Item rows (CSV/NPY) parsed per block
+        chunk_bytes: Bytes of JSONL parsed per block (a longer line is
+            parsed on its own)
+
+    Yields:
+        tuple: (instance_id, weights, values, capacity)
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+    if fmt == 'npy':
+        yield from _group_rows(_npy_blocks(path, chunk_rows))
+        return
+    if fmt == 'jsonl':
+        f = sys.stdin.buffer if path == '-' else open(path, 'rb')
+    else:
+        f = sys.stdin if path == '-' else open(path)
+    try:
+        if fmt == 'jsonl':
+            yield from _jsonl_instances(f, chunk_bytes)
+        else:
+            yield from _group_rows(_csv_blocks(f, chunk_rows))
+    finally:
+        if f not in (sys.stdin, sys.stdin.buffer):
+            f.close()
+
+
+def instances_to_rows(instances):
+    """
+    Flatten (weights, values, capacity) instances into CSV/NPY rows.
+
+    Returns:
+        int64 array of shape (total items, 4): instance, weight, value, capacity
+    """
+    blocks = [np.column_stack([np.full(len(w), i), w, v, np.full(len(w), c)]).astype(np.int64)
+              for i, (w, v, c) in enumerate(instances) if len(w)]
+    return np.concatenate(blocks) if blocks else np.zeros((0, 4), dtype=np.int64)
+
+
+def test():
+    import os
+    import random
+    import tempfile
+
+    rng = random.Random(24)
+    instances = []
+    for _ in range(200):
+        n = rng.randint(1, 15)
+        instances.append(([rng.randint(0, 20) for _ in range(n)], [rng.randint(0, 50) for _ in range(n)],
+                          rng.randint(0, 60)))
+    rows = instances_to_rows(instances)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {fmt: os.path.join(tmp, f'instances.{fmt}') for fmt in FORMATS}
+        with open(paths['jsonl'], 'w') as f:
+            for i, (w, v, c) in enumerate(instances):
+                f.write(json.dumps({'id': i, 'weights': w, 'values': v, 'capacity': c}) + '\n')
+        with open(paths['csv'], 'w') as f:
+            f.write('instance,weight,value,capacity\n')
+            np.savetxt(f, rows, fmt='%d', delimiter=',')
+        np.save(paths['npy'], rows)
+
+        # Test 1: every format round-trips, even with blocks that split instances
+        for fmt, path in paths.items():
+            for chunk_rows, chunk_bytes in ((7, 1), (7, 300), (65536, 4 * 1024 * 1024)):
+                loaded = list(iter_instances(path, chunk_rows=chunk_rows, chunk_bytes=chunk_bytes))
+                assert len(loaded) == len(instances), f"Test 1 Failed: {fmt} gave {len(loaded)} instances"
+                for i, (instance_id, w, v, c) in enumerate(loaded):
+                    assert instance_id == i and (w.tolist(), v.tolist(), c) == instances[i], f"Test 1 Failed: {fmt}"
+                    assert w.dtype == np.int64
+
+        # Test 2: default ids are line numbers, blank lines included
+        with open(paths['jsonl'], 'w') as f:
+            f.write('{"weights": [1], "values": [2], "capacity": 3}\n\n\n')
+            f.write('{"weights": [4], "values": [5], "capacity": 6}\n')
+        for chunk_bytes in (1, 50, 4 * 1024 * 1024):
+            assert [i for i, _, _, _ in iter_instances(paths['jsonl'], chunk_bytes=chunk_bytes)] == [0, 3]
+
+        # JSONL blocks are bounded by bytes, not by a count of instances
+        with open(paths['jsonl'], 'rb') as f:
+            blocks = list(_jsonl_blocks(f, 49))
+        assert [len(block) for block in blocks] == [3, 1]
+
+        # Test 3: an instance spanning many blocks
+        long_rows = instances_to_rows([([1] * 5000, [2] * 5000, 9), ([3], [4], 5)])
+        np.save(paths['npy'], long_rows)
+        loaded = list(iter_instances(paths['npy'], chunk_rows=16))
+        assert [len(w) for _, w, _, _ in loaded] == [5000, 1] and loaded[1][3] == 5
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
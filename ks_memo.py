@@ -0,0 +1,322 @@
+"""
+Bounded-memory memo tables for the top-down solver.
+
+ks_top_down.knapsack only uses ``in``, item get/set and ``len`` on its
+memo_table, and KnapsackVisualizer.visualize_memo_table reads keys, values
+and items. Any mapping with those operations can be passed in place of the
+plain dict, including the bounded ones here. An evicted state is simply
+recomputed the next time it is needed, so the answer stays exact; the cost
+of a small limit is extra work, not a wrong result.
+
+- LRUMemo: drops the least recently used state
+- LevelMemo: drops whole item levels, those nearest the leaves first
+- ArrayMemo: two flat int64 arrays (16 bytes per slot instead of a dict
+  entry with a tuple key); with fewer slots than states it acts as a
+  direct-mapped cache and a colliding state replaces the old one
+
+RecordingMemo wraps any of these (or a plain dict) and logs every stored
+state in order, which visualization.animator replays frame by frame.
+"""
+
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from ks_top_down import NOT_COMPUTED
+
+
+class _BoundedMemo(MutableMapping):
+    """Shared size limit and counters."""
+
+    def __init__(self, max_size=None):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.evictions = 0
+        self.peak_size = 0
+
+    def _stored(self):
+        self.peak_size = max(self.peak_size, len(self))
+
+    def memo_stats(self):
+        """Size limit and eviction counters."""
+        return {'size': len(self), 'max_size': self.max_size,
+                'peak_size': self.peak_size, 'evictions': self.evictions}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.memo_stats()})"
+
+
+class LRUMemo(_BoundedMemo):
+    """
+    Memo that keeps at most max_size states, evicting the least recently used
+    (max_size=None never evicts).
+    """
+
+    def __init__(self, max_size=None):
+        super().__init__(max_size)
+        self._data = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while self.max_size is not None and len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        self._stored()
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    # Reading the whole memo (e.g. for the visualizer) must not reorder it
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+
+class LevelMemo(_BoundedMemo):
+    """
+    Memo grouped by item level n that evicts a whole level at a time.
+
+    A state (n, w) is only read while computing states of level n + 1, and
+    the depth-first search only finishes a level when the root finishes, so
+    there is no level that is certain to be unused. The levels with the
+    fewest items are the cheapest to recompute, so those go first. The level
+    being written is never dropped as a whole; if it is the only one left,
+    its oldest states are evicted instead. max_size=None never evicts.
+    """
+
+    def __init__(self, max_size=None):
+        super().__init__(max_size)
+        self._levels = {}
+        self._size = 0
+
+    def __contains__(self, key):
+        level = self._levels.get(key[0])
+        return level is not None and key[1] in level
+
+    def __getitem__(self, key):
+        try:
+            return self._levels[key[0]][key[1]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        n, w = key
+        level = self._levels.setdefault(n, {})
+        if w not in level:
+            self._size += 1
+        level[w] = value
+        while self.max_size is not None and self._size > self.max_size:
+            lower = [k for k in self._levels if k != n]
+            if lower:
+                dropped = self._levels.pop(min(lower))
+                self._size -= len(dropped)
+                self.evictions += len(dropped)
+            else:
+                del level[next(iter(level))]
+                self._size -= 1
+                self.evictions += 1
+        self._stored()
+
+    def __delitem__(self, key):
+        level = self._levels[key[0]]
+        del level[key[1]]
+        self._size -= 1
+        if not level:
+            del self._levels[key[0]]
+
+    def __iter__(self):
+        for n, level in self._levels.items():
+            for w in level:
+                yield (n, w)
+
+    def __len__(self):
+        return self._size
+
+
+class ArrayMemo(_BoundedMemo):
+    """
+    Memo stored in two flat int64 arrays indexed like new_flat_memo.
+
+    With max_size=None there is one slot per state and nothing is evicted
+    (the same memory as new_flat_memo plus the key array). A smaller
+    max_size allocates that many slots and maps state idx to slot
+    idx % max_size, replacing whatever was there.
+    """
+
+    def __init__(self, n, capacity, max_size=None):
+        super().__init__(max_size)
+        self.stride = capacity + 1
+        states = (n + 1) * self.stride
+        slots = states if max_size is None else min(max_size, states)
+        self._keys = array('q', [NOT_COMPUTED]) * max(slots, 1)
+        self._values = array('q', [0]) * max(slots, 1)
+        self._size = 0
+
+    def _slot(self, key):
+        idx = key[0] * self.stride + key[1]
+        return idx, idx % len(self._keys)
+
+    def __contains__(self, key):
+        idx, slot = self._slot(key)
+        return self._keys[slot] == idx
+
+    def __getitem__(self, key):
+        idx, slot = self._slot(key)
+        if self._keys[slot] != idx:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def __setitem__(self, key, value):
+        idx, slot = self._slot(key)
+        old = self._keys[slot]
+        if old == NOT_COMPUTED:
+            self._size += 1
+        elif old != idx:
+            self.evictions += 1
+        self._keys[slot] = idx
+        self._values[slot] = value
+        self._stored()
+
+    def __delitem__(self, key):
+        idx, slot = self._slot(key)
+        if self._keys[slot] != idx:
+            raise KeyError(key)
+        self._keys[slot] = NOT_COMPUTED
+        self._size -= 1
+
+    def __iter__(self):
+        for idx in self._keys:
+            if idx != NOT_COMPUTED:
+                yield divmod(idx, self.stride)
+
+    def __len__(self):
+        return self._size
+
+
+class RecordingMemo(MutableMapping):
+    """
+    Memo wrapper that records every state stored, in order.
+    """
+
+    def __init__(self, memo=None):
+        """
+        Args:
+            memo: Memo to wrap (defaults to a new dict)
+        """
+        self.memo = {} if memo is None else memo
+        self._rows = array('q')
+        self._cols = array('q')
+        self._values = array('q')
+
+    def __contains__(self, key):
+        return key in self.memo
+
+    def __getitem__(self, key):
+        return self.memo[key]
+
+    def __setitem__(self, key, value):
+        self.memo[key] = value
+        self._rows.append(key[0])
+        self._cols.append(key[1])
+        self._values.append(value)
+
+    def __delitem__(self, key):
+        del self.memo[key]
+
+    def __iter__(self):
+        return iter(self.memo)
+
+    def __len__(self):
+        return len(self.memo)
+
+    def events(self):
+        """
+        Stored states in order so far.
+
+        Returns:
+            tuple: (rows, cols, values) int64 NumPy arrays, copies so that
+            recording can go on while they are in use
+        """
+        return (np.array(self._rows, dtype=np.int64), np.array(self._cols, dtype=np.int64),
+                np.array(self._values, dtype=np.int64))
+
+
+def test():
+    from ks_top_down import knapsack
+    import random
+
+    rng = random.Random(18)
+    for _ in range(100):
+        n = rng.randint(0, 10)
+        w = [rng.randint(0, 12) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 30)
+        full = {}
+        expected = knapsack(n, capacity, w, v, full)
+
+        # Test 1: tiny limits still give the exact answer
+        for memo in (LRUMemo(3), LevelMemo(3), ArrayMemo(n, capacity, max_size=3)):
+            result = knapsack(n, capacity, w, v, memo)
+            assert result == expected, f"Test 1 Failed: {memo!r} got {result}, expected {expected}"
+            assert len(memo) <= 3 and memo.peak_size <= 3
+
+        # Test 2: an unbounded array memo stores exactly the dict's states
+        memo = ArrayMemo(n, capacity)
+        assert knapsack(n, capacity, w, v, memo) == expected
+        assert dict(memo.items()) == full and memo.evictions == 0
+
+    # Test 3: half the states fit; evictions are counted and the memo is
+    # visualizer-compatible
+    w3 = [rng.randint(1, 20) for _ in range(20)]
+    v3 = [rng.randint(1, 50) for _ in range(20)]
+    full3 = {}
+    expected3 = knapsack(20, 150, w3, v3, full3)
+    limit = len(full3) // 2
+    for memo in (LRUMemo(limit), LevelMemo(limit), ArrayMemo(20, 150, max_size=limit)):
+        assert knapsack(20, 150, w3, v3, memo) == expected3
+        stats = memo.memo_stats()
+        assert stats['evictions'] > 0 and stats['size'] <= limit, f"Test 3 Failed: {stats}"
+        assert all(0 < n <= 20 and 0 < c <= 150 for n, c in memo.keys())
+        assert len(list(memo.values())) == len(memo)
+
+    # An unbounded memo is a plain memo with counters
+    for memo in (LRUMemo(), LevelMemo(), ArrayMemo(20, 150)):
+        assert knapsack(20, 150, w3, v3, memo) == expected3
+        assert memo.memo_stats() == {'size': len(full3), 'max_size': None,
+                                     'peak_size': len(full3), 'evictions': 0}
+
+    # Test 4: recording keeps the answer and logs each stored state once
+    recorder = RecordingMemo()
+    assert knapsack(20, 150, w3, v3, recorder) == expected3
+    rows, cols, values = recorder.events()
+    assert len(rows) == len(full3) and dict(zip(zip(rows.tolist(), cols.tolist()), values.tolist())) == full3
+
+    # events() can be read while the same recorder keeps recording
+    recorder[(0, 0)] = 0
+    assert len(recorder.events()[0]) == len(rows) + 1
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
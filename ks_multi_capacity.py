@@ -0,0 +1,135 @@
+"""
+Answer many capacities for the same item set from a single DP pass.
+
+The last row of the bottom-up table already holds the optimum for every
+capacity up to W, so one fill up to the largest requested capacity answers
+all queries. With reconstruction, the packed take/skip bits from ks_bitset
+are shared by all queries, and backtracking paths that meet the same
+(i, w) state reuse the part of the selection already found.
+"""
+
+import numpy as np
+
+from ks_bitset import fill_decisions, is_taken
+from ks_vectorized import knapsack_row
+
+
+def _selections(bits, weights, capacities):
+    """
+    Reconstruct the selected items for every capacity from shared decision bits.
+
+    Args:
+        bits: Packed decision table from fill_decisions
+        weights: List of item weights
+        capacities: Capacities to reconstruct
+
+    Returns:
+        List of selected item lists, one per capacity
+    """
+    n = len(weights)
+    # (i, w) -> linked list (item, rest) of the items picked among the first i
+    # items when i items are left at capacity w; None means nothing is picked
+    tails = {}
+    results = {}
+
+    for capacity in capacities:
+        if capacity in results:
+            continue
+
+        # Walk down until we reach a state another query already resolved
+        path = []
+        i, w = n, capacity
+        while i > 0 and (i, w) not in tails:
+            path.append((i, w))
+            if is_taken(bits, i - 1, w):
+                w -= weights[i - 1]
+            i -= 1
+
+        tail = tails.get((i, w))
+        for i, w in reversed(path):
+            if is_taken(bits, i - 1, w):
+                tail = (i - 1, tail)
+            tails[(i, w)] = tail
+
+        selected_items = []
+        while tail is not None:
+            selected_items.append(tail[0])
+            tail = tail[1]
+        selected_items.reverse()
+        results[capacity] = selected_items
+
+    return [list(results[c]) for c in capacities]
+
+
+def knapsack_multi_capacity(weights, values, capacities, reconstruct=False, dtype=np.int64):
+    """
+    Solve the same items for many capacities with one fill up to the largest.
+
+    Time Complexity: O(n * max(capacities)) for the fill, plus O(n) per
+        distinct capacity path when reconstructing
+    Space Complexity: O(max(capacities)), or O(n * max(capacities) / 8)
+        bytes when reconstructing
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacities: List or array of capacities
+        reconstruct: Also return the selected items for each capacity
+        dtype: NumPy integer dtype used for the row
+
+    Returns:
+        tuple: (max_values, selections) where max_values is an int64 array
+        aligned with capacities and selections is a list of selected item
+        lists (None when reconstruct is False)
+    """
+    capacities = np.asarray(capacities, dtype=np.int64).ravel()
+    if len(capacities) == 0:
+        return np.zeros(0, dtype=np.int64), ([] if reconstruct else None)
+    if capacities.min() < 0:
+        raise ValueError("capacities must be non-negative")
+    max_capacity = int(capacities.max())
+
+    if not reconstruct:
+        row = knapsack_row(weights, values, max_capacity, dtype=dtype)
+        return row[capacities].astype(np.int64), None
+
+    row, bits = fill_decisions(weights, values, max_capacity, dtype=dtype)
+    selections = _selections(bits, weights, capacities.tolist())
+    return row[capacities].astype(np.int64), selections
+
+
+def test():
+    from ks_bottom_up import knapsack_bottom_up, solve_knapsack
+    import random
+
+    # Test 1: every capacity of a small instance
+    w1 = [2, 3, 4, 5, 6]
+    v1 = [3, 4, 8, 8, 10]
+    max_values, selections = knapsack_multi_capacity(w1, v1, range(11), reconstruct=True)
+    for capacity in range(11):
+        expected, expected_items, _ = solve_knapsack(w1, v1, capacity)
+        assert max_values[capacity] == expected, f"Test 1 Failed at capacity {capacity}"
+        assert selections[capacity] == expected_items, f"Test 1 Failed at capacity {capacity}"
+
+    # Test 2: values only, unsorted with duplicates
+    max_values, selections = knapsack_multi_capacity(w1, v1, [10, 3, 10, 0])
+    assert max_values.tolist() == [18, 4, 18, 0] and selections is None
+
+    # Random cases against the reference solver
+    rng = random.Random(8)
+    for _ in range(50):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacities = [rng.randint(0, 40) for _ in range(rng.randint(1, 6))]
+        max_values, selections = knapsack_multi_capacity(w, v, capacities, reconstruct=True)
+        for capacity, max_value, selected in zip(capacities, max_values, selections):
+            assert max_value == knapsack_bottom_up(n, capacity, w, v)
+            assert sum(v[i] for i in selected) == max_value
+            assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
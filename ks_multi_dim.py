@@ -0,0 +1,308 @@
+"""
+Multi-constraint (e.g. weight + volume) 0/1 knapsack.
+
+Each item has one weight per resource and the knapsack one capacity per
+resource. The DP state is a single NumPy tensor of shape
+(C1+1, C2+1, ...), where cell [c1, c2, ...] is the best value within those
+limits. Items are applied one at a time as a shifted maximum over the whole
+tensor, rolling in place like the 1D row in ks_vectorized, and the take/skip
+decisions are kept as packed bits for reconstruction.
+
+The tensor grows with the product of the capacities, so its size is
+estimated before anything is allocated. Above memory_limit the solver
+either raises MemoryError or falls back to a depth-first branch and bound
+whose bound is the smallest of the per-resource Dantzig bounds.
+"""
+
+from math import floor, prod
+
+import numpy as np
+
+from ks_vectorized import check_dtype
+
+
+def estimate_memory(n, capacities, dtype=np.int64, reconstruct=True):
+    """
+    Bytes needed by the tensor DP at its peak.
+
+    Besides the value tensor and the decision bits this counts what
+    apply_item_nd allocates for every item: the shifted copy with_item
+    (up to a full tensor) and the boolean take mask.
+
+    Args:
+        n: Number of items
+        capacities: One capacity per resource
+        dtype: NumPy integer dtype of the value tensor
+        reconstruct: Count the packed decision bits as well
+
+    Returns:
+        Estimated number of bytes
+    """
+    cells = prod(c + 1 for c in capacities)
+    total = cells * (2 * np.dtype(dtype).itemsize + 1)
+    if reconstruct:
+        total += n * ((cells + 7) // 8)
+    return total
+
+
+def apply_item_nd(tensor, weight, value):
+    """
+    Update the value tensor in place with one more item.
+
+    Args:
+        tensor: NumPy array with one axis per resource
+        weight: Item weight per resource
+        value: Item value
+
+    Returns:
+        Boolean array shaped like tensor, True where the item is taken
+    """
+    take = np.zeros(tensor.shape, dtype=bool)
+    if value <= 0 or any(w >= size for w, size in zip(weight, tensor.shape)):
+        return take
+    dst = tuple(slice(w, None) for w in weight)
+    src = tuple(slice(0, size - w) for w, size in zip(weight, tensor.shape))
+    with_item = tensor[src] + value
+    np.greater(with_item, tensor[dst], out=take[dst])
+    np.maximum(tensor[dst], with_item, out=tensor[dst])
+    return take
+
+
+def solve_knapsack_tensor(weights, values, capacities, dtype=np.int64):
+    """
+    Solve by tensor DP with reconstruction from packed decision bits.
+
+    Time Complexity: O(n * prod(C+1)) vectorized operations
+    Space Complexity: O(prod(C+1)) values plus n * prod(C+1) / 8 bytes of bits
+
+    Args:
+        weights: List of per-item weight tuples, one entry per resource
+        values: List of item values
+        capacities: One capacity per resource
+        dtype: NumPy integer dtype of the value tensor
+
+    Returns:
+        tuple: (max_value, selected_items)
+    """
+    dtype = check_dtype(values, dtype)
+    shape = tuple(c + 1 for c in capacities)
+    tensor = np.zeros(shape, dtype=dtype)
+    bits = []
+    for weight, value in zip(weights, values):
+        bits.append(np.packbits(apply_item_nd(tensor, weight, value).ravel()))
+
+    selected_items = []
+    position = list(capacities)
+    for i in range(len(weights) - 1, -1, -1):
+        flat = int(np.ravel_multi_index(position, shape))
+        if (bits[i][flat >> 3] >> (7 - (flat & 7))) & 1:
+            selected_items.append(i)
+            position = [p - w for p, w in zip(position, weights[i])]
+    selected_items.reverse()
+    return int(tensor[tuple(capacities)]), selected_items
+
+
+def solve_knapsack_multi_branch_bound(weights, values, capacities, stats=None):
+    """
+    Solve exactly by depth-first branch and bound.
+
+    Each node is bounded by the Dantzig relaxation of every resource on its
+    own (items that no longer fit in some resource are left out) and the
+    smallest of those bounds is used.
+
+    Args:
+        weights: List of per-item weight tuples, one entry per resource
+        values: List of item values
+        capacities: One capacity per resource
+        stats: Optional dict (or instrumentation.SolveStats) that receives
+            'nodes_explored' and 'nodes_pruned'
+
+    Returns:
+        tuple: (max_value, selected_items)
+    """
+    dims = range(len(capacities))
+    forced_items = []
+    candidates = []
+    for i, (weight, value) in enumerate(zip(weights, values)):
+        if value <= 0 or any(w > c for w, c in zip(weight, capacities)):
+            continue
+        if not any(weight):
+            forced_items.append(i)
+        else:
+            candidates.append(i)
+
+    # search order: value per unit of capacity-normalized total weight
+    def density(i):
+        used = sum(weights[i][d] / capacities[d] for d in dims if capacities[d] > 0)
+        return values[i] / used if used else float('inf')
+
+    order = sorted(candidates, key=lambda i: (-density(i), i))
+    position = {item: k for k, item in enumerate(order)}
+    by_dim = [sorted(order, key=lambda i, d=d: (-(values[i] / weights[i][d]) if weights[i][d] else -float('inf'), i))
+              for d in dims]
+    integral = all(isinstance(v, int) for v in values)
+
+    def bound(k, remaining):
+        best = None
+        for d in dims:
+            room = remaining[d]
+            total = 0
+            for i in by_dim[d]:
+                if position[i] < k or any(w > r for w, r in zip(weights[i], remaining)):
+                    continue
+                w = weights[i][d]
+                if w <= room:
+                    room -= w
+                    total += values[i]
+                else:
+                    total += room * values[i] / w
+                    break
+            if best is None or total < best:
+                best = total
+        return floor(best) if integral else best
+
+    # greedy incumbent in search order
+    best_value = 0
+    best_chosen = []
+    remaining = list(capacities)
+    for i in order:
+        if all(w <= r for w, r in zip(weights[i], remaining)):
+            remaining = [r - w for r, w in zip(remaining, weights[i])]
+            best_value += values[i]
+            best_chosen.append(i)
+
+    nodes_explored = 0
+    nodes_pruned = 0
+    stack = [(0, tuple(capacities), 0, None)]
+    while stack:
+        k, remaining, value, chosen = stack.pop()
+        nodes_explored += 1
+        if value > best_value:
+            best_value = value
+            best_chosen = []
+            node = chosen
+            while node is not None:
+                best_chosen.append(order[node[0]])
+                node = node[1]
+        if k == len(order):
+            continue
+        if value + bound(k, remaining) <= best_value:
+            nodes_pruned += 1
+            continue
+
+        # exclude item k, then include it (explored first)
+        stack.append((k + 1, remaining, value, chosen))
+        weight = weights[order[k]]
+        if all(w <= r for w, r in zip(weight, remaining)):
+            stack.append((k + 1, tuple(r - w for r, w in zip(remaining, weight)),
+                          value + values[order[k]], (k, chosen)))
+
+    if stats is not None:
+        stats['nodes_explored'] = nodes_explored
+        stats['nodes_pruned'] = nodes_pruned
+
+    selected_items = sorted(forced_items + best_chosen)
+    return sum(values[i] for i in selected_items), selected_items
+
+
+def solve_knapsack_multi(weights, values, capacities, dtype=np.int64, memory_limit=2**30,
+                         fallback="branch_bound", stats=None):
+    """
+    Solve the multi-constraint 0/1 knapsack, picking the engine by memory.
+
+    Args:
+        weights: List of per-item weight tuples, one entry per resource
+        values: List of item values
+        capacities: One capacity per resource
+        dtype: NumPy integer dtype of the value tensor
+        memory_limit: Largest tensor DP (see estimate_memory) to allocate, in bytes
+        fallback: "branch_bound" to fall back above the limit, None to raise
+        stats: Optional dict (or instrumentation.SolveStats) that receives
+            'estimated_bytes' and, for branch and bound, its node counters
+
+    Returns:
+        tuple: (max_value, selected_items)
+
+    Raises:
+        ValueError: If an item's weight tuple does not match capacities
+        MemoryError: If the tensor is over memory_limit and fallback is None
+    """
+    for i, weight in enumerate(weights):
+        if len(weight) != len(capacities):
+            raise ValueError(f"item {i} has {len(weight)} weights for {len(capacities)} capacities")
+
+    estimated = estimate_memory(len(weights), capacities, dtype=dtype)
+    if stats is not None:
+        stats['estimated_bytes'] = estimated
+    if estimated <= memory_limit:
+        return solve_knapsack_tensor(weights, values, capacities, dtype=dtype)
+    if fallback == "branch_bound":
+        return solve_knapsack_multi_branch_bound(weights, values, capacities, stats=stats)
+    raise MemoryError(f"tensor DP needs about {estimated} bytes, over the limit of {memory_limit}")
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    from itertools import combinations
+    import random
+
+    def brute_force(weights, values, capacities):
+        best = 0
+        for r in range(len(weights) + 1):
+            for subset in combinations(range(len(weights)), r):
+                if all(sum(weights[i][d] for i in subset) <= c for d, c in enumerate(capacities)):
+                    best = max(best, sum(values[i] for i in subset))
+        return best
+
+    # Test 1: volume makes the lighter pair infeasible
+    weights = [(4, 1), (2, 5), (3, 5)]
+    values = [10, 4, 7]
+    assert solve_knapsack_multi(weights, values, (5, 8)) == (10, [0])
+    assert solve_knapsack_multi(weights, values, (5, 10)) == (11, [1, 2])
+
+    # Test 2: one resource matches the 1D engine
+    w2 = [2, 3, 4, 5, 6]
+    v2 = [3, 4, 8, 8, 10]
+    expected, expected_items, _ = solve_knapsack(w2, v2, 10)
+    assert solve_knapsack_multi([(w,) for w in w2], v2, (10,)) == (expected, expected_items)
+
+    # Test 3: over the limit, fall back or refuse
+    stats = {}
+    assert solve_knapsack_multi(weights, values, (5, 10), memory_limit=0, stats=stats)[0] == 11
+    assert stats['estimated_bytes'] > 0 and stats['nodes_explored'] >= 1
+    try:
+        solve_knapsack_multi(weights, values, (5, 10), memory_limit=0, fallback=None)
+        assert False, "Test 3 Failed: no MemoryError"
+    except MemoryError:
+        pass
+
+    # Test 4: the estimate covers the traced peak, temporaries included
+    import tracemalloc
+    w4 = [(w, w // 2 + 1) for w in range(1, 6)]
+    tracemalloc.start()
+    solve_knapsack_tensor(w4, [3, 5, 7, 9, 11], (999, 999))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak <= estimate_memory(len(w4), (999, 999)), f"Test 4 Failed: peak {peak}"
+
+    # Random cases against brute force, both engines
+    rng = random.Random(20)
+    for _ in range(150):
+        n = rng.randint(0, 8)
+        dims = rng.randint(1, 3)
+        weights = [tuple(rng.randint(0, 8) for _ in range(dims)) for _ in range(n)]
+        values = [rng.randint(0, 20) for _ in range(n)]
+        capacities = tuple(rng.randint(0, 15) for _ in range(dims))
+        expected = brute_force(weights, values, capacities)
+        for limit in (2**30, 0):
+            max_value, selected = solve_knapsack_multi(weights, values, capacities, memory_limit=limit)
+            assert max_value == expected, f"Expected {expected}, got {max_value} (limit {limit})"
+            assert sum(values[i] for i in selected) == max_value
+            for d, c in enumerate(capacities):
+                assert sum(weights[i][d] for i in selected) <= c
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
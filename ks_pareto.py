@@ -0,0 +1,139 @@
+"""
+Sparse Pareto-frontier (dominance list) solver for the 0/1 Knapsack Problem.
+
+For every item prefix keep only the non-dominated (weight, value) states,
+sorted by weight with strictly increasing value. Adding an item merges the
+frontier with a copy shifted by (weight, value) and drops dominated states.
+The cost depends on the frontier sizes, not on the capacity W, so it suits
+instances with huge capacities and few distinct useful states.
+"""
+
+import numpy as np
+
+from ks_vectorized import check_dtype
+
+
+def merge_item(frontier_weights, frontier_values, weight, value, capacity):
+    """
+    Add one item to a Pareto frontier.
+
+    Args:
+        frontier_weights: Sorted int64 array of state weights
+        frontier_values: int64 array of state values, strictly increasing
+        weight: Item weight
+        value: Item value
+        capacity: Maximum weight capacity
+
+    Returns:
+        tuple: (weights, values) of the new frontier
+    """
+    # Taking an item that adds no value can only produce dominated states
+    if value <= 0:
+        return frontier_weights, frontier_values
+
+    fits = frontier_weights <= capacity - weight
+    if not fits.any():
+        return frontier_weights, frontier_values
+
+    all_weights = np.concatenate((frontier_weights, frontier_weights[fits] + weight))
+    all_values = np.concatenate((frontier_values, frontier_values[fits] + value))
+
+    # Sort by weight, heaviest value first on ties, then keep a state only if
+    # it beats every lighter state
+    order = np.lexsort((-all_values, all_weights))
+    all_weights = all_weights[order]
+    all_values = all_values[order]
+    keep = np.empty(len(all_values), dtype=bool)
+    keep[0] = True
+    keep[1:] = all_values[1:] > np.maximum.accumulate(all_values)[:-1]
+    return all_weights[keep], all_values[keep]
+
+
+def _contains(frontier_weights, frontier_values, weight, value):
+    idx = np.searchsorted(frontier_weights, weight)
+    return (idx < len(frontier_weights) and frontier_weights[idx] == weight
+            and frontier_values[idx] == value)
+
+
+def solve_knapsack_pareto(weights, values, capacity, reconstruct=True):
+    """
+    Solve 0/1 knapsack by merging non-dominated (weight, value) states.
+
+    Time Complexity: O(sum of frontier sizes * log) -- independent of W
+    Space Complexity: O(largest frontier), or O(sum of frontier sizes)
+        when reconstructing
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        reconstruct: Keep every frontier so the selected items can be recovered
+
+    Returns:
+        tuple: (max_value, selected_items), selected_items is None when
+        reconstruct is False
+    """
+    check_dtype(values, np.int64)
+    frontier_weights = np.zeros(1, dtype=np.int64)
+    frontier_values = np.zeros(1, dtype=np.int64)
+    history = []
+
+    for weight, value in zip(weights, values):
+        if reconstruct:
+            history.append((frontier_weights, frontier_values))
+        frontier_weights, frontier_values = merge_item(
+            frontier_weights, frontier_values, weight, value, capacity)
+
+    # Values increase with weight and every state fits, so the last one is best
+    max_value = int(frontier_values[-1])
+    if not reconstruct:
+        return max_value, None
+
+    selected_items = []
+    w = int(frontier_weights[-1])
+    v = max_value
+    for i in range(len(weights) - 1, -1, -1):
+        prev_weights, prev_values = history[i]
+        if not _contains(prev_weights, prev_values, w, v):
+            selected_items.append(i)
+            w -= weights[i]
+            v -= values[i]
+    selected_items.reverse()
+    return max_value, selected_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: choose best combination (not all fit)
+    max_value, selected = solve_knapsack_pareto([4, 2, 3], [10, 4, 7], 5)
+    assert max_value == 11 and selected == [1, 2], f"Test 1 Failed: got {max_value}, {selected}"
+
+    # Test 2: huge capacity is no problem
+    w2 = [10**8, 3 * 10**8, 4 * 10**8, 5 * 10**8]
+    v2 = [1, 4, 5, 7]
+    max_value, selected = solve_knapsack_pareto(w2, v2, 7 * 10**8)
+    assert max_value == 9 and sum(w2[i] for i in selected) <= 7 * 10**8, f"Test 2 Failed: got {max_value}"
+
+    # Test 3: value only
+    assert solve_knapsack_pareto(w2, v2, 7 * 10**8, reconstruct=False) == (9, None)
+
+    # Random cases against the full table
+    rng = random.Random(4)
+    for _ in range(100):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        max_value, selected = solve_knapsack_pareto(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(v[i] for i in selected) == expected
+        assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
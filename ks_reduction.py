@@ -0,0 +1,316 @@
+"""
+Instance reduction pre-pass for the 0/1 Knapsack Problem.
+
+Before running any engine, shrink the instance:
+
+1. Drop items that can never help (value <= 0 or heavier than the capacity)
+   and always take zero-weight items with positive value.
+2. Dominance: item j is dropped when the items that are at least as light
+   and at least as valuable weigh more than capacity - w_j together. Any
+   solution holding j then misses one of them, and swapping it in for j
+   never hurts.
+3. Item fixing: with a greedy lower bound LB, an item is fixed in when the
+   Dantzig bound without it is below LB, and fixed out when the bound with
+   it forced in is below LB.
+4. Divide the remaining weights and the capacity by the weights' GCD.
+
+The reduced solution is mapped back to the original item indices. With a
+deadline, passes 2 and 3 stop early once it is reached; every item they
+removed or fixed up to then is still justified, so the reduction stays exact,
+only smaller.
+"""
+
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from math import floor, gcd
+
+from ks_branch_bound import greedy_by_ratio
+
+
+ReducedInstance = namedtuple('ReducedInstance', [
+    'weights',           # weights of the items left to decide (divided by scale)
+    'values',            # values of the items left to decide
+    'capacity',          # capacity left for them (divided by scale)
+    'original_indices',  # original index of every remaining item
+    'fixed_items',       # original indices of items that are always taken
+    'fixed_value',       # total value of fixed_items
+    'scale',             # GCD the weights and capacity were divided by
+    'report',            # ReductionReport
+])
+
+ReductionReport = namedtuple('ReductionReport', [
+    'n_before', 'n_after', 'capacity_before', 'capacity_after',
+    'removed_useless', 'removed_dominated', 'fixed_in', 'fixed_out',
+])
+
+
+class _FenwickTree:
+    """Prefix sums with point updates, used for the dominance check."""
+
+    def __init__(self, size):
+        self.tree = [0] * (size + 1)
+
+    def add(self, pos, amount):
+        pos += 1
+        while pos < len(self.tree):
+            self.tree[pos] += amount
+            pos += pos & -pos
+
+    def prefix_sum(self, pos):
+        """Sum of positions 0..pos."""
+        pos += 1
+        total = 0
+        while pos > 0:
+            total += self.tree[pos]
+            pos -= pos & -pos
+        return total
+
+
+def _past(deadline, count):
+    """True every 1024th step once the deadline has passed."""
+    return deadline is not None and count % 1024 == 0 and time.perf_counter() >= deadline
+
+
+def _dominated(items, weights, values, capacity, deadline=None):
+    """
+    Find items made redundant by lighter, more valuable ones.
+
+    Args:
+        items: Candidate item indices
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        deadline: Optional time.perf_counter() value at which to stop looking
+
+    Returns:
+        Set of dominated item indices
+    """
+    # Visit items so that every dominating item comes first, then keep a
+    # running sum of weights per value rank (rank 0 = highest value)
+    order = sorted(items, key=lambda i: (weights[i], -values[i], i))
+    distinct_values = sorted({values[i] for i in items}, reverse=True)
+    rank = {v: r for r, v in enumerate(distinct_values)}
+    tree = _FenwickTree(len(distinct_values))
+
+    dominated = set()
+    for count, i in enumerate(order):
+        if _past(deadline, count):
+            break
+        dominating_weight = tree.prefix_sum(rank[values[i]])
+        if dominating_weight + weights[i] > capacity:
+            dominated.add(i)
+        tree.add(rank[values[i]], weights[i])
+    return dominated
+
+
+class _SkipBound:
+    """Dantzig upper bound over ratio-sorted items with one item left out."""
+
+    def __init__(self, weights, values, order):
+        self.weights = [weights[i] for i in order]
+        self.values = [values[i] for i in order]
+        self.prefix_weights = [0]
+        self.prefix_values = [0]
+        for w, v in zip(self.weights, self.values):
+            self.prefix_weights.append(self.prefix_weights[-1] + w)
+            self.prefix_values.append(self.prefix_values[-1] + v)
+        self.integral = all(isinstance(v, int) for v in self.values)
+
+    def __call__(self, remaining, skip):
+        """Fractional optimum of all sorted items except position skip."""
+        pw, pv = self.prefix_weights, self.prefix_values
+        m = len(self.weights)
+        if remaining < pw[skip]:
+            # the critical item comes before skip, so skipping changes nothing
+            j = bisect_right(pw, remaining) - 1
+            used, bound = pw[j], pv[j]
+        else:
+            # every item before skip fits; continue past it
+            j = bisect_right(pw, remaining + self.weights[skip]) - 1
+            used = pw[j] - self.weights[skip]
+            bound = pv[j] - self.values[skip]
+        if j < m:
+            bound += (remaining - used) * self.values[j] / self.weights[j]
+            if self.integral:
+                bound = floor(bound)
+        return bound
+
+
+def _fix_items(items, weights, values, capacity, deadline=None):
+    """
+    Fix items in or out by comparing bounds against the greedy solution.
+    Items not reached by the deadline are left undecided.
+
+    Returns:
+        tuple: (fixed_in, fixed_out) lists of item indices
+    """
+    if not items:
+        return [], []
+    order = sorted(items, key=lambda i: (-values[i] / weights[i], i))
+    bound = _SkipBound(weights, values, order)
+    lower_bound, _ = greedy_by_ratio([weights[i] for i in order], [values[i] for i in order], capacity)
+
+    fixed_in = []
+    fixed_out = []
+    for pos, i in enumerate(order):
+        if _past(deadline, pos):
+            break
+        if bound(capacity, pos) < lower_bound:
+            fixed_in.append(i)
+        elif values[i] + bound(capacity - weights[i], pos) < lower_bound:
+            fixed_out.append(i)
+    return fixed_in, fixed_out
+
+
+def reduce_instance(weights, values, capacity, deadline=None):
+    """
+    Shrink a knapsack instance without changing its optimal value.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        deadline: Optional time.perf_counter() value after which the
+            dominance and fixing passes stop early
+
+    Returns:
+        ReducedInstance describing the remaining items and how to map back
+    """
+    n = len(weights)
+    fixed_items = []
+    items = []
+    removed_useless = 0
+    for i in range(n):
+        if values[i] <= 0 or weights[i] > capacity:
+            removed_useless += 1
+        elif weights[i] == 0:
+            fixed_items.append(i)
+        else:
+            items.append(i)
+
+    dominated = _dominated(items, weights, values, capacity, deadline)
+    items = [i for i in items if i not in dominated]
+
+    if deadline is not None and time.perf_counter() >= deadline:
+        fixed_in, fixed_out = [], []
+    else:
+        fixed_in, fixed_out = _fix_items(items, weights, values, capacity, deadline)
+    fixed_items.extend(fixed_in)
+    remaining = capacity - sum(weights[i] for i in fixed_in)
+    decided = set(fixed_in) | set(fixed_out)
+    # Fixing items in may leave some undecided items too heavy to ever fit
+    too_heavy = [i for i in items if i not in decided and weights[i] > remaining]
+    decided.update(too_heavy)
+    items = [i for i in items if i not in decided]
+
+    scale = 0
+    for i in items:
+        scale = gcd(scale, weights[i])
+    scale = max(scale, 1)
+
+    report = ReductionReport(
+        n_before=n,
+        n_after=len(items),
+        capacity_before=capacity,
+        capacity_after=remaining // scale,
+        removed_useless=removed_useless,
+        removed_dominated=len(dominated),
+        fixed_in=len(fixed_items),
+        fixed_out=len(fixed_out) + len(too_heavy),
+    )
+    return ReducedInstance(
+        weights=[weights[i] // scale for i in items],
+        values=[values[i] for i in items],
+        capacity=remaining // scale,
+        original_indices=items,
+        fixed_items=sorted(fixed_items),
+        fixed_value=sum(values[i] for i in fixed_items),
+        scale=scale,
+        report=report,
+    )
+
+
+def expand_solution(reduced, max_value, selected_items):
+    """
+    Map a solution of the reduced instance back to the original one.
+
+    Args:
+        reduced: ReducedInstance from reduce_instance
+        max_value: Optimal value of the reduced instance
+        selected_items: Selected indices into the reduced instance
+
+    Returns:
+        tuple: (max_value, selected_items) for the original instance
+    """
+    original = [reduced.original_indices[i] for i in selected_items]
+    return max_value + reduced.fixed_value, sorted(original + reduced.fixed_items)
+
+
+def solve_reduced(weights, values, capacity, engine="table"):
+    """
+    Reduce the instance, solve it with any solve_knapsack engine and map back.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        engine: Engine name accepted by solve_knapsack
+
+    Returns:
+        tuple: (max_value, selected_items, report)
+    """
+    from ks_bottom_up import solve_knapsack
+
+    reduced = reduce_instance(weights, values, capacity)
+    max_value, selected_items, _ = solve_knapsack(reduced.weights, reduced.values, reduced.capacity,
+                                                  engine=engine)
+    max_value, selected_items = expand_solution(reduced, max_value, selected_items)
+    return max_value, selected_items, reduced.report
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: useless, dominated and scaled items
+    w1 = [10, 20, 20, 40, 500, 0]
+    v1 = [5, 30, 10, 50, 999, 3]
+    reduced = reduce_instance(w1, v1, 50)
+    assert 4 not in reduced.original_indices and 5 in reduced.fixed_items
+    assert reduced.report.n_after < len(w1)
+    max_value, selected, report = solve_reduced(w1, v1, 50)
+    assert max_value == solve_knapsack(w1, v1, 50)[0], f"Test 1 Failed: got {max_value}"
+    assert max_value == sum(v1[i] for i in selected)
+
+    # Test 2: GCD scaling
+    reduced = reduce_instance([6, 9, 12, 15], [7, 10, 13, 16], 31)
+    assert reduced.scale in (1, 3) and reduced.capacity <= 31
+
+    # Random cases against the full table, for several engines
+    rng = random.Random(12)
+    for _ in range(300):
+        n = rng.randint(0, 12)
+        g = rng.choice([1, 1, 2, 5])
+        w = [g * rng.randint(0, 10) for _ in range(n)]
+        v = [rng.randint(-2, 30) for _ in range(n)]
+        capacity = rng.randint(0, 60)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        for engine in ("table", "bitset", "branch_bound"):
+            max_value, selected, report = solve_reduced(w, v, capacity, engine=engine)
+            assert max_value == expected, f"Expected {expected}, got {max_value} with {engine}"
+            assert sum(v[i] for i in selected) == expected
+            assert sum(w[i] for i in selected) <= capacity
+            assert report.n_after <= report.n_before
+
+        # a deadline already passed skips dominance and fixing, still exact
+        reduced = reduce_instance(w, v, capacity, deadline=0)
+        assert reduced.report.removed_dominated == 0 and reduced.report.fixed_out == 0
+        max_value, selected, _ = solve_knapsack(reduced.weights, reduced.values, reduced.capacity)
+        assert expand_solution(reduced, max_value, selected)[0] == expected
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,341 @@
+"""
+Local asyncio solve service with request coalescing and micro-batching.
+
+Many concurrent callers await KnapsackService.solve instead of each blocking
+on solve_knapsack. Requests are grouped by item set:
+
+- identical requests (same items and capacity) share one result
+- requests for the same items but different capacities wait a short batch
+  window and are answered together by one knapsack_multi_capacity pass
+  (one fill up to the largest capacity, shared decision bits)
+
+The DP runs in a worker pool (a process pool by default) so the event loop
+stays responsive. Each request may carry a deadline; a request that times
+out before its batch starts is dropped from the batch. The same service is
+exposed over a local TCP or Unix socket speaking JSON lines:
+
+    {"id": 1, "weights": [...], "values": [...], "capacity": 10, "timeout": 0.5}
+    -> {"id": 1, "max_value": 18, "selected_items": [2, 4]}
+    {"id": 2, "metrics": true}
+    -> {"id": 2, "metrics": {...}}
+
+Run the server with:  python ks_service.py --port 8765  (or --unix PATH)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ks_multi_capacity import knapsack_multi_capacity
+
+
+def _solve_group(weights, values, capacities):
+    """Worker entry point: one multi-capacity pass with reconstruction."""
+    max_values, selections = knapsack_multi_capacity(weights, values, capacities, reconstruct=True)
+    return max_values.tolist(), selections
+
+
+class _Group:
+    """Pending requests for one item set: capacity -> (future, waiter count)."""
+
+    def __init__(self):
+        self.pending = {}
+        self.timer = None
+
+
+class KnapsackService:
+    """
+    In-process asyncio front end to the solvers.
+    """
+
+    def __init__(self, executor=None, workers=None, batch_window=0.002, max_batch=256):
+        """
+        Initialize the service.
+
+        Args:
+            executor: concurrent.futures executor for the DP (defaults to a
+                ProcessPoolExecutor owned by the service)
+            workers: Worker processes for the default executor (defaults to os.cpu_count())
+            batch_window: Seconds to wait for more capacities of the same items
+            max_batch: Distinct capacities that dispatch a group immediately
+        """
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._groups = {}
+        # running batch tasks, kept referenced until they finish
+        self._tasks = set()
+        self.requests = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.completed = 0
+        self.batches = 0
+        self.batched_queries = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the default executor."""
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+    def metrics(self):
+        """Queue-depth and throughput counters."""
+        return {
+            'requests': self.requests,
+            'completed': self.completed,
+            'coalesced': self.coalesced,
+            'timeouts': self.timeouts,
+            'batches': self.batches,
+            'batched_queries': self.batched_queries,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'in_flight': self.in_flight,
+        }
+
+    async def solve(self, weights, values, capacity, timeout=None):
+        """
+        Solve one instance, batched with concurrent requests for the same items.
+
+        Args:
+            weights: List of item weights
+            values: List of item values
+            capacity: Maximum weight capacity
+            timeout: Optional deadline in seconds
+
+        Returns:
+            tuple: (max_value, selected_items)
+
+        Raises:
+            asyncio.TimeoutError: If the deadline passes first
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        key = (tuple(weights), tuple(values))
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group()
+            group.timer = loop.call_later(self.batch_window, self._dispatch, key)
+
+        entry = group.pending.get(capacity)
+        if entry is None:
+            entry = [loop.create_future(), 0]
+            group.pending[capacity] = entry
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            if len(group.pending) >= self.max_batch:
+                group.timer.cancel()
+                self._dispatch(key)
+        else:
+            self.coalesced += 1
+        entry[1] += 1
+
+        try:
+            # shield: one caller timing out must not cancel the shared result
+            result = await asyncio.wait_for(asyncio.shield(entry[0]), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            # timed out, cancelled or answered: this caller no longer waits
+            entry[1] -= 1
+        self.completed += 1
+        return result
+
+    def _dispatch(self, key):
+        """Send one group's live capacities to the executor."""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        self.queue_depth -= len(group.pending)
+        live = {c: entry for c, entry in group.pending.items() if entry[1] > 0}
+        for c, entry in group.pending.items():
+            if c not in live:
+                entry[0].cancel()
+        if not live:
+            return
+        self.batches += 1
+        self.batched_queries += len(live)
+        self.in_flight += 1
+        task = asyncio.ensure_future(self._run(key, live))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key, live):
+        loop = asyncio.get_running_loop()
+        weights, values = key
+        capacities = list(live)
+        try:
+            max_values, selections = await loop.run_in_executor(
+                self.executor, _solve_group, list(weights), list(values), capacities)
+        except Exception as exc:
+            for future, _ in live.values():
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for c, max_value, selected in zip(capacities, max_values, selections):
+                future = live[c][0]
+                if not future.done():
+                    future.set_result((max_value, selected))
+        finally:
+            self.in_flight -= 1
+
+
+async def _handle_connection(service, reader, writer):
+    """Serve one JSON-lines connection; requests on it run concurrently."""
+    lock = asyncio.Lock()
+
+    async def reply(message):
+        async with lock:
+            writer.write((json.dumps(message) + '\n').encode())
+            await writer.drain()
+
+    async def handle(line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            if request.get('metrics'):
+                await reply({'id': request_id, 'metrics': service.metrics()})
+                return
+            max_value, selected_items = await service.solve(
+                request['weights'], request['values'], request['capacity'], timeout=request.get('timeout'))
+            await reply({'id': request_id, 'max_value': max_value, 'selected_items': selected_items})
+        except asyncio.TimeoutError:
+            await reply({'id': request_id, 'error': 'deadline exceeded'})
+        except Exception as exc:
+            await reply({'id': request_id, 'error': f'{type(exc).__name__}: {exc}'})
+
+    tasks = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.ensure_future(handle(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        writer.close()
+
+
+async def start_server(service, host='127.0.0.1', port=8765, path=None):
+    """
+    Start the JSON-lines server on a local TCP port or a Unix socket path.
+
+    Returns:
+        asyncio.Server
+    """
+    def handler(reader, writer):
+        return _handle_connection(service, reader, writer)
+
+    if path is not None:
+        return await asyncio.start_unix_server(handler, path=path)
+    return await asyncio.start_server(handler, host=host, port=port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local knapsack solve service (JSON lines).")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help="serve on this Unix socket path instead of TCP")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--batch-window', type=float, default=0.002)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        async with KnapsackService(workers=args.workers, batch_window=args.batch_window) as service:
+            server = await start_server(service, args.host, args.port, args.unix)
+            where = args.unix or f"{args.host}:{args.port}"
+            print(f"Serving knapsack requests on {where}")
+            async with server:
+                await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def test():
+    from concurrent.futures import ThreadPoolExecutor
+    from ks_bottom_up import solve_knapsack
+
+    w = [2, 3, 4, 5, 6]
+    v = [3, 4, 8, 8, 10]
+
+    async def scenario():
+        with ThreadPoolExecutor(2) as executor:
+            service = KnapsackService(executor=executor, batch_window=0.01)
+
+            # Test 1: 60 concurrent requests, 11 distinct capacities, one DP pass
+            capacities = [c % 11 for c in range(60)]
+            results = await asyncio.gather(*(service.solve(w, v, c) for c in capacities))
+            for c, (max_value, selected) in zip(capacities, results):
+                expected, expected_items, _ = solve_knapsack(w, v, c)
+                assert (max_value, selected) == (expected, expected_items), f"Test 1 Failed at {c}"
+            metrics = service.metrics()
+            assert metrics['batches'] == 1 and metrics['coalesced'] == 49, f"Test 1 Failed: {metrics}"
+            assert metrics['max_queue_depth'] == 11 and metrics['queue_depth'] == 0
+
+            # Test 2: a deadline shorter than the batch window
+            try:
+                await service.solve(w, v, 7, timeout=0.001)
+                assert False, "Test 2 Failed: no timeout"
+            except asyncio.TimeoutError:
+                pass
+            await asyncio.sleep(0.02)
+            assert service.metrics()['timeouts'] == 1 and service.metrics()['batches'] == 1
+
+            # a cancelled caller's capacity is dropped as well
+            task = asyncio.ensure_future(service.solve(w, v, 8))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.sleep(0.02)
+            assert task.cancelled() and service.metrics()['batches'] == 1
+            assert not service._tasks
+
+            # Test 3: JSON lines over TCP
+            server = await start_server(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            for request_id, capacity in enumerate([10, 5]):
+                request = {'id': request_id, 'weights': w, 'values': v, 'capacity': capacity}
+                writer.write((json.dumps(request) + '\n').encode())
+            writer.write(b'{"id": 9, "capacity": 1}\n')
+            await writer.drain()
+            replies = {}
+            for _ in range(3):
+                reply = json.loads(await reader.readline())
+                replies[reply['id']] = reply
+            assert replies[0]['max_value'] == 18 and replies[0]['selected_items'] == [2, 4]
+            assert replies[1]['max_value'] == solve_knapsack(w, v, 5)[0]
+            assert 'error' in replies[9]
+            writer.close()
+            await writer.wait_closed()
+            await asyncio.sleep(0.01)  # let the handler see EOF
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(scenario())
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+from array import array
 
-def knapsack(n, remaining_weights, wts, vals, memo_table):
+
+
+def knapsack(n, remaining_weights, wts, vals, memo_table, stats=None):
 
     #print(f"Checking n={n}, remaining_weights={remaining_weights}")
 
@@ -12,25 +15,172 @@ def knapsack(n, remaining_weights, wts, vals, memo_table):
     # check the table if the (n, remaining_weights) pair already exists:
     if (n, remaining_weights) in memo_table:
         #print(f"Using memoized value for n={n}, remaining_weights={remaining_weights}: {memo_table[(n, remaining_weights)]}")
+        if stats is not None:
+            stats.memo_hits += 1
         return memo_table[(n, remaining_weights)]
-    
+
+    # optional instrumentation (see instrumentation.SolveStats)
+    if stats is not None:
+        if stats.depth == 0:
+            stats.start('fill')
+        stats.memo_misses += 1
+        stats.enter()
+
     pick = 0
     # check if the remaining weight is less than current weight. If yes then pick the item
     if wts[n - 1] <= remaining_weights:
         #print(f"Including item {n} (weight={wts[n - 1]}, value={vals[n - 1]})")
-        pick = vals[n - 1] + knapsack(n - 1, (remaining_weights - wts[n - 1]), wts, vals, memo_table)
+        pick = vals[n - 1] + knapsack(n - 1, (remaining_weights - wts[n - 1]), wts, vals, memo_table, stats)
 
     # don't pick the item
     #print(f"Excluding item {n}")
-    not_pick = knapsack(n - 1, remaining_weights, wts, vals, memo_table)
+    not_pick = knapsack(n - 1, remaining_weights, wts, vals, memo_table, stats)
 
     result = max(pick, not_pick)
     # store the max in memo table and return it
     memo_table [(n, remaining_weights)] = result
     #print(f"Best for n={n}, remaining_weights={remaining_weights} is {result}")
 
+    if stats is not None:
+        stats.leave()
+        stats.states_computed += 1
+        stats.peak_memo_size = max(stats.peak_memo_size, len(memo_table))
+        stats.space = stats.peak_memo_size
+        if stats.depth == 0:
+            stats.stop('fill')
+
     return result
 
+# Sentinel stored in a flat memo for states that have not been computed yet.
+# Every computed state is >= 0, so -1 can never collide with a real value.
+NOT_COMPUTED = -1
+
+
+def new_flat_memo(n, capacity):
+    """
+    Allocate a flat memo for knapsack_iterative.
+
+    State (n, remaining_weights) lives at index n * (capacity + 1) + remaining_weights.
+    The array stores machine integers (8 bytes per state), so values must fit in int64.
+
+    Args:
+        n: Number of items
+        capacity: Maximum weight capacity
+
+    Returns:
+        array('q') of length (n + 1) * (capacity + 1) filled with NOT_COMPUTED
+    """
+    return array('q', [NOT_COMPUTED]) * ((n + 1) * (capacity + 1))
+
+
+def flat_memo_to_dict(memo, capacity):
+    """
+    Convert a flat memo into the {(n, remaining_weights): value} dict used by
+    knapsack and KnapsackVisualizer.visualize_memo_table.
+
+    Args:
+        memo: Flat memo filled by knapsack_iterative
+        capacity: Capacity the memo was allocated for
+
+    Returns:
+        Dictionary with only the computed states
+    """
+    stride = capacity + 1
+    return {divmod(idx, stride): value for idx, value in enumerate(memo) if value != NOT_COMPUTED}
+
+
+def knapsack_iterative(n, capacity, wts, vals, memo, stats=None):
+    """
+    Top-down knapsack with an explicit work stack instead of recursion.
+
+    Visits exactly the same reachable states as knapsack (so the memo can still
+    be visualized), but never touches Python's recursion limit and does not
+    build a tuple key per probe.
+
+    Args:
+        n: Number of items
+        capacity: Maximum weight capacity
+        wts: List of item weights
+        vals: List of item values
+        memo: Flat memo from new_flat_memo(n, capacity)
+        stats: Optional instrumentation.SolveStats filled in place
+
+    Returns:
+        Maximum value that can be achieved
+    """
+    if n == 0 or capacity == 0:
+        return 0
+
+    stride = capacity + 1
+    stack = [n * stride + capacity]
+    if stats is not None:
+        stats.start('fill')
+
+    while stack:
+        entry = stack[-1]
+        # a negative entry (~idx) returns to a state whose children are now done
+        revisit = entry < 0
+        idx = ~entry if revisit else entry
+        if not revisit and memo[idx] != NOT_COMPUTED:
+            # pushed before another path computed it: knapsack would find it in the memo
+            stack.pop()
+            if stats is not None:
+                stats.memo_hits += 1
+            continue
+        if stats is not None and len(stack) > stats.max_depth:
+            stats.max_depth = len(stack)
+
+        # lookups count as hits on the first pass only, like knapsack's calls
+        count_hits = stats is not None and not revisit
+        top = len(stack) - 1
+        i, w = divmod(idx, stride)
+        missing = False
+
+        # don't pick the item: state (i - 1, w)
+        not_pick = 0
+        if i > 1:
+            not_pick = memo[idx - stride]
+            if not_pick == NOT_COMPUTED:
+                stack.append(idx - stride)
+                missing = True
+            elif count_hits:
+                stats.memo_hits += 1
+
+        # pick the item if it fits: state (i - 1, w - wts[i - 1])
+        pick = 0
+        weight = wts[i - 1]
+        if weight <= w:
+            pick = vals[i - 1]
+            if i > 1 and w > weight:
+                child = idx - stride - weight
+                sub = memo[child]
+                if sub == NOT_COMPUTED:
+                    stack.append(child)
+                    missing = True
+                else:
+                    pick += sub
+                    if count_hits:
+                        stats.memo_hits += 1
+
+        # children first, then come back to this state
+        if missing:
+            stack[top] = ~idx
+            continue
+
+        memo[idx] = max(pick, not_pick)
+        stack.pop()
+        if stats is not None:
+            stats.memo_misses += 1
+            stats.states_computed += 1
+
+    if stats is not None:
+        stats.stop('fill')
+        # stored states, as len(memo_table) in knapsack
+        stats.peak_memo_size = stats.space = len(memo) - memo.count(NOT_COMPUTED)
+
+    return memo[n * stride + capacity]
+
+
 def test():
     # Test 1: smaller capacity
     w = [1, 3, 4]
@@ -77,6 +227,27 @@ def test():
     result5 = knapsack(len(w5), capacity5, w5, v5, m5)
     assert result5 == expected5, f"Test 5 Failed: got {result5}"
 
+    # Test 6: iterative engine matches the recursive one, including the memo
+    import random
+    rng = random.Random(2)
+    for _ in range(100):
+        n6 = rng.randint(0, 10)
+        w6 = [rng.randint(0, 12) for _ in range(n6)]
+        v6 = [rng.randint(0, 30) for _ in range(n6)]
+        capacity6 = rng.randint(0, 30)
+        m6 = {}
+        expected6 = knapsack(n6, capacity6, w6, v6, m6)
+        flat6 = new_flat_memo(n6, capacity6)
+        result6 = knapsack_iterative(n6, capacity6, w6, v6, flat6)
+        assert result6 == expected6, f"Test 6 Failed: got {result6}"
+        assert flat_memo_to_dict(flat6, capacity6) == m6, "Test 6 Failed: different states visited"
+
+    # Test 7: far beyond the recursion limit
+    n7 = 5000
+    flat7 = new_flat_memo(n7, 50)
+    result7 = knapsack_iterative(n7, 50, [7] * n7, [3] * n7, flat7)
+    assert result7 == 21, f"Test 7 Failed: got {result7}"
+
     print("✅ All test cases passed!")
 
         
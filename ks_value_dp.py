@@ -0,0 +1,116 @@
+"""
+Value-indexed dynamic programming for the 0/1 Knapsack Problem.
+
+Instead of dp[i][w] = best value with capacity w, keep
+row[v] = minimum weight needed to reach exactly value v. The row has
+sum(values) + 1 cells, so when values are small integers and weights or the
+capacity are huge this table is far smaller than the capacity-indexed one.
+"""
+
+import numpy as np
+
+from ks_bitset import backtrack_bits
+
+
+def fill_min_weights(weights, values, capacity):
+    """
+    Fill the rolling minimum-weight row and record take/skip bits.
+
+    Weights above the capacity can never be used, so every cell is clamped at
+    capacity + 1, which also stands for "value not reachable".
+
+    Time Complexity: O(n * V) vectorized operations, V = sum of values
+    Space Complexity: O(V) for the row plus O(n * V / 8) bytes for the bits
+
+    Args:
+        weights: List of item weights
+        values: List of non-negative integer item values
+        capacity: Maximum weight capacity
+
+    Returns:
+        tuple: (row, bits) where row[v] is the minimum weight for value v
+        and bit v of bits[i] is set when item i is taken for value v
+    """
+    total_value = sum(v for v in values if v > 0)
+    unreachable = capacity + 1
+    row = np.full(total_value + 1, unreachable, dtype=np.int64)
+    row[0] = 0
+    bits = np.zeros((len(weights), (total_value + 8) // 8), dtype=np.uint8)
+
+    take = np.zeros(total_value + 1, dtype=bool)
+    for i, (weight, value) in enumerate(zip(weights, values)):
+        if value <= 0 or weight > capacity:
+            continue
+        with_item = np.minimum(row[:-value] + weight, unreachable)
+        take[:] = False
+        np.less(with_item, row[value:], out=take[value:])
+        np.minimum(row[value:], with_item, out=row[value:])
+        bits[i] = np.packbits(take)
+    return row, bits
+
+
+def best_fitting_value(row, capacity):
+    """
+    Largest value whose minimum weight fits in the capacity.
+
+    Args:
+        row: Minimum-weight row from fill_min_weights
+        capacity: Maximum weight capacity
+
+    Returns:
+        The best achievable value
+    """
+    return int(np.flatnonzero(row <= capacity)[-1])
+
+
+def solve_knapsack_by_value(weights, values, capacity):
+    """
+    Solve 0/1 knapsack with a table indexed by total value.
+
+    Args:
+        weights: List of item weights
+        values: List of non-negative integer item values
+        capacity: Maximum weight capacity
+
+    Returns:
+        tuple: (max_value, selected_items)
+    """
+    row, bits = fill_min_weights(weights, values, capacity)
+    max_value = best_fitting_value(row, capacity)
+    # the bits are indexed by value, so walk back by values instead of weights
+    selected_items = backtrack_bits(bits, values, max_value)
+    return max_value, selected_items
+
+
+def test():
+    from ks_bottom_up import solve_knapsack
+    import random
+
+    # Test 1: choose best combination (not all fit)
+    max_value, selected = solve_knapsack_by_value([4, 2, 3], [10, 4, 7], 5)
+    assert max_value == 11 and selected == [1, 2], f"Test 1 Failed: got {max_value}, {selected}"
+
+    # Test 2: huge weights and capacity, small values
+    w2 = [3 * 10**9, 4 * 10**9, 5 * 10**9, 10**9]
+    v2 = [4, 5, 7, 1]
+    max_value, selected = solve_knapsack_by_value(w2, v2, 9 * 10**9)
+    assert max_value == 12 and sum(w2[i] for i in selected) <= 9 * 10**9, f"Test 2 Failed: got {max_value}"
+
+    # Random cases against the full table
+    rng = random.Random(7)
+    for _ in range(100):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected, _, _ = solve_knapsack(w, v, capacity)
+        max_value, selected = solve_knapsack_by_value(w, v, capacity)
+        assert max_value == expected, f"Expected {expected}, got {max_value}"
+        assert sum(v[i] for i in selected) == expected
+        assert sum(w[i] for i in selected) <= capacity
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
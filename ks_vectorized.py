@@ -0,0 +1,162 @@
+"""
+Vectorized bottom-up engine for the 0/1 Knapsack Problem.
+
+Keeps a single DP row as a NumPy array and applies each item with one
+shifted-slice maximum instead of a Python loop over every capacity.
+"""
+
+import numpy as np
+
+
+def check_dtype(values, dtype):
+    """
+    Make sure the largest possible knapsack value fits in the row dtype.
+
+    Args:
+        values: List of item values
+        dtype: NumPy integer dtype used for the DP row
+
+    Returns:
+        The dtype as a numpy.dtype object
+
+    Raises:
+        ValueError: If dtype is not an integer type or the sum of the
+            positive values would overflow it
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iu':
+        raise ValueError(f"dtype must be an integer type, got {dtype}")
+    best_possible = sum(v for v in values if v > 0)
+    if best_possible > np.iinfo(dtype).max:
+        raise ValueError(f"values sum to {best_possible}, which overflows {dtype}")
+    return dtype
+
+
+def apply_item(row, weight, value):
+    """
+    Update a DP row in place with one more item.
+
+    After the call row[w] holds the best value using the previous items plus
+    this one with capacity w. The right-hand side is evaluated into a
+    temporary before writing, so reading and writing the same row is safe.
+
+    Args:
+        row: 1D NumPy array, dp[i-1][0..W] on entry and dp[i][0..W] on exit
+        weight: Item weight
+        value: Item value
+    """
+    if value <= 0 or weight >= len(row):
+        return
+    if weight == 0:
+        row += value
+        return
+    np.maximum(row[weight:], row[:-weight] + value, out=row[weight:])
+
+
+def apply_item_with_decision(row, weight, value):
+    """
+    Same as apply_item but also reports where the item was taken.
+
+    Args:
+        row: 1D NumPy array updated in place
+        weight: Item weight
+        value: Item value
+
+    Returns:
+        Boolean array of length len(row), True at capacity w when the item
+        is part of the optimum for dp[i][w]
+    """
+    take = np.zeros(len(row), dtype=bool)
+    if value <= 0 or weight >= len(row):
+        return take
+    if weight == 0:
+        row += value
+        take[:] = True
+        return take
+    with_item = row[:-weight] + value
+    np.greater(with_item, row[weight:], out=take[weight:])
+    np.maximum(row[weight:], with_item, out=row[weight:])
+    return take
+
+
+def knapsack_row(weights, values, capacity, dtype=np.int64):
+    """
+    Compute the last DP row, i.e. the best value for every capacity 0..W.
+
+    Time Complexity: O(n * W) vectorized operations
+    Space Complexity: O(W) for the single rolling row
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+        dtype: NumPy integer dtype used for the row
+
+    Returns:
+        1D NumPy array where row[w] = max value with capacity w
+    """
+    dtype = check_dtype(values, dtype)
+    row = np.zeros(capacity + 1, dtype=dtype)
+    for weight, value in zip(weights, values):
+        apply_item(row, weight, value)
+    return row
+
+
+def knapsack_vectorized(n, capacity, weights, values, dtype=np.int64):
+    """
+    Drop-in replacement for knapsack_bottom_up using the rolling NumPy row.
+
+    Args:
+        n: Number of items
+        capacity: Maximum weight capacity of knapsack
+        weights: List of item weights
+        values: List of item values
+        dtype: NumPy integer dtype used for the row (int64 by default; a
+            smaller type such as int32 halves memory traffic when the values
+            allow it)
+
+    Returns:
+        Maximum value that can be achieved
+    """
+    row = knapsack_row(weights[:n], values[:n], capacity, dtype=dtype)
+    return int(row[capacity])
+
+
+def test():
+    from ks_bottom_up import knapsack_bottom_up
+    import random
+
+    cases = [
+        ([1, 3, 4], [1, 4, 5], 3, 4),
+        ([1, 2, 3], [10, 15, 40], 0, 0),
+        ([1, 2, 3], [10, 20, 30], 6, 60),
+        ([4, 2, 3], [10, 4, 7], 5, 11),
+        ([10], [100], 5, 0),
+    ]
+    for w, v, capacity, expected in cases:
+        result = knapsack_vectorized(len(w), capacity, w, v)
+        assert result == expected, f"Expected {expected}, got {result}"
+
+    # Random cases against the reference table, including int32 rows
+    rng = random.Random(0)
+    for _ in range(50):
+        n = rng.randint(0, 12)
+        w = [rng.randint(0, 15) for _ in range(n)]
+        v = [rng.randint(0, 30) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        expected = knapsack_bottom_up(n, capacity, w, v)
+        assert knapsack_vectorized(n, capacity, w, v) == expected
+        assert knapsack_vectorized(n, capacity, w, v, dtype=np.int32) == expected
+
+    # Overflowing dtype is rejected
+    try:
+        knapsack_vectorized(2, 5, [1, 2], [100, 100], dtype=np.int8)
+        assert False, "int8 overflow was not detected"
+    except ValueError:
+        pass
+
+    print("✅ All test cases passed!")
+
+
+if __name__ == "__main__":
+    test()
@@ -4,5 +4,6 @@ Works with both top-down (memoization) and bottom-up (tabulation) approaches.
 """
 
 from .visualizer import KnapsackVisualizer
+from .animator import KnapsackAnimator
 
-__all__ = ['KnapsackVisualizer']
\ No newline at end of file
+__all__ = ['KnapsackVisualizer', 'KnapsackAnimator']
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Animation of the DP table filling up.
+
+The fill is recorded first as a stream of cell updates (row, col, value):
+for the bottom-up table through the on_row hook of solve_knapsack, and for
+top-down memoization through ks_memo.RecordingMemo. The stream is then
+replayed in batches, one batch per frame. A single figure with a single
+imshow artist is created up front; every frame only writes the batch into
+the displayed array (max-pooled onto LARGE_GRID for large tables, one
+np.fmax.at per batch) and calls set_data, so the cost of a frame depends
+on the batch size, not on how much of the table is already drawn.
+
+Animations are saved as MP4 when ffmpeg is available and as GIF through
+Pillow otherwise.
+"""
+
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+
+try:
+    from .visualizer import KnapsackVisualizer
+except ImportError:
+    from visualizer import KnapsackVisualizer
+
+
+class KnapsackAnimator(KnapsackVisualizer):
+    """
+    Records a solve and replays it as an animation.
+    """
+
+    MAX_FRAMES = 150
+
+    def record_bottom_up(self):
+        """
+        Solve with the table engine, recording every row.
+
+        Returns:
+            tuple: ((rows, cols, values) event arrays, max_value)
+        """
+        from ks_bottom_up import solve_knapsack
+
+        cols = np.arange(self.capacity + 1)
+        events = [(np.zeros_like(cols), cols, np.zeros_like(cols))]
+
+        def on_row(i, row):
+            events.append((np.full_like(cols, i), cols, np.asarray(row, dtype=np.int64)))
+
+        max_value, _, _ = solve_knapsack(self.weights, self.values, self.capacity, on_row=on_row)
+        return tuple(np.concatenate(part) for part in zip(*events)), max_value
+
+    def record_top_down(self):
+        """
+        Solve with memoized recursion, recording every stored state.
+
+        Returns:
+            tuple: ((rows, cols, values) event arrays, max_value)
+        """
+        from ks_memo import RecordingMemo
+        from ks_top_down import knapsack
+
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * self.n + 100))
+        memo = RecordingMemo()
+        max_value = knapsack(self.n, self.capacity, self.weights, self.values, memo)
+        return memo.events(), max_value
+
+    def animate(self, events, save_path=None, title="Filling the DP Table", fps=20, max_frames=None):
+        """
+        Replay recorded cell updates as an animation.
+
+        Args:
+            events: (rows, cols, values) arrays from record_bottom_up/record_top_down
+            save_path: .mp4 or .gif file (MP4 falls back to GIF without ffmpeg);
+                None shows the animation
+            title: Title for the plot
+            fps: Frames per second
+            max_frames: Frames to split the updates into (defaults to MAX_FRAMES)
+
+        Returns:
+            Path the animation was saved to, or None when shown
+        """
+        rows, cols, values = (np.asarray(part, dtype=np.int64) for part in events)
+        shape = (self.n + 1, self.capacity + 1)
+        block_rows, block_cols = self._blocks(*shape) if self._is_large(*shape) else (1, 1)
+        display = np.full((-(-shape[0] // block_rows), -(-shape[1] // block_cols)), np.nan)
+        block_r, block_c = rows // block_rows, cols // block_cols
+
+        total = len(rows)
+        frames = max(1, min(max_frames or self.MAX_FRAMES, total))
+        bounds = np.linspace(0, total, frames + 1).astype(np.int64)
+
+        fig, ax = plt.subplots(figsize=(12, 7))
+        cmap = plt.get_cmap('YlOrRd').copy()
+        cmap.set_bad('#eeeeee')
+        im = ax.imshow(display, cmap=cmap, aspect='auto', vmin=0, vmax=max(int(values.max(initial=0)), 1),
+                       **self._grid_kwargs(*shape))
+        fig.colorbar(im, ax=ax, label='Maximum Value')
+        ax.set_xlabel('Capacity (w)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Items (i)', fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        self._set_ticks(ax)
+        progress = ax.text(0.01, 1.01, '', transform=ax.transAxes, fontsize=10)
+
+        def update(frame):
+            start, end = bounds[frame], bounds[frame + 1]
+            np.fmax.at(display, (block_r[start:end], block_c[start:end]), values[start:end])
+            im.set_data(display)
+            progress.set_text(f'{end}/{total} cells computed')
+            return im, progress
+
+        try:
+            if save_path is None:
+                anim = animation.FuncAnimation(fig, update, frames=frames, interval=1000 / fps,
+                                               blit=False, repeat=False)
+                plt.show()
+                return None
+            # Drive the writer directly: one draw per frame
+            save_path, writer = self._writer(save_path, fps)
+            with writer.saving(fig, save_path, dpi=self.LARGE_DPI):
+                for frame in range(frames):
+                    update(frame)
+                    writer.grab_frame()
+            print(f"  ✓ Saved: {save_path}")
+            return save_path
+        finally:
+            plt.close(fig)
+
+    def _writer(self, save_path, fps):
+        """MP4 via ffmpeg when available, otherwise GIF via Pillow."""
+        root, ext = os.path.splitext(save_path)
+        if ext.lower() == '.mp4':
+            if animation.writers.is_available('ffmpeg'):
+                return save_path, animation.FFMpegWriter(fps=fps)
+            save_path = root + '.gif'
+            print("  ffmpeg not found, saving a GIF instead")
+        return save_path, animation.PillowWriter(fps=fps)
+
+    def animate_bottom_up(self, save_path=None, **kwargs):
+        """Record and animate the bottom-up fill."""
+        events, _ = self.record_bottom_up()
+        return self.animate(events, save_path, title="Bottom-Up Table Fill", **kwargs)
+
+    def animate_top_down(self, save_path=None, **kwargs):
+        """Record and animate the order in which memoization computes states."""
+        events, _ = self.record_top_down()
+        return self.animate(events, save_path, title="Top-Down Memoization Order", **kwargs)
+
+
+if __name__ == "__main__":
+    output = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+    os.makedirs(output, exist_ok=True)
+    animator = KnapsackAnimator([2, 3, 4, 5, 6], [3, 4, 8, 8, 10], 10)
+    animator.animate_bottom_up(os.path.join(output, 'bottom_up_fill.gif'), fps=4)
+    animator.animate_top_down(os.path.join(output, 'top_down_fill.gif'), fps=4)
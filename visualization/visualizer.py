@@ -8,6 +8,7 @@ import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 
 
 class KnapsackVisualizer:
@@ -29,8 +30,78 @@ class KnapsackVisualizer:
         self.values = values
         self.capacity = capacity
         self.n = len(weights)
+
+    # Tables with more cells than this are drawn in large-table mode: the
+    # table is max-pooled down to at most LARGE_GRID (rows, cols) blocks,
+    # cell annotations and per-cell ticks are dropped and the figure is
+    # saved at LARGE_DPI, so render time no longer grows with the table.
+    ANNOTATE_LIMIT = 2500
+    TICK_LIMIT = 40
+    ITEM_INFO_LIMIT = 25
+    LARGE_GRID = (500, 1000)
+    LARGE_DPI = 100
+
+    def _is_large(self, rows, cols):
+        return rows * cols > self.ANNOTATE_LIMIT
+
+    def _blocks(self, rows, cols):
+        """Block size (rows, cols) that maps the table onto LARGE_GRID."""
+        max_rows, max_cols = self.LARGE_GRID
+        return -(-rows // max_rows), -(-cols // max_cols)
+
+    def _max_pool(self, array):
+        """
+        Downsample a 2D array by taking the maximum of each block.
+
+        The array is reduced one band of block rows at a time with
+        np.maximum.reduceat, so a numpy.memmap (e.g. ks_disk's dp_table) is
+        only paged in band by band and never copied whole.
+
+        Args:
+            array: 2D numpy array or memmap
+
+        Returns:
+            tuple: (pooled array, imshow keyword arguments that keep the
+            axes in original table coordinates)
+        """
+        rows, cols = array.shape
+        block_rows, block_cols = self._blocks(rows, cols)
+        col_starts = np.arange(0, cols, block_cols)
+        pooled = np.empty((-(-rows // block_rows), len(col_starts)), dtype=array.dtype)
+        for out_row, start in enumerate(range(0, rows, block_rows)):
+            band = array[start:start + block_rows]
+            pooled[out_row] = np.maximum.reduceat(band, col_starts, axis=1).max(axis=0)
+        return pooled, self._grid_kwargs(rows, cols)
+
+    def _grid_kwargs(self, rows, cols):
+        return {'extent': (-0.5, cols - 0.5, rows - 0.5, -0.5), 'interpolation': 'nearest'}
+
+    def _set_ticks(self, ax):
+        """One tick per item/capacity on small tables, automatic ticks otherwise."""
+        if self.capacity + 1 <= self.TICK_LIMIT:
+            ax.set_xticks(range(self.capacity + 1))
+        if self.n + 1 <= self.TICK_LIMIT:
+            ax.set_yticks(range(self.n + 1))
+
+    def _item_info(self):
+        shown = min(self.n, self.ITEM_INFO_LIMIT)
+        item_info = '\n'.join([f'Item {i}: W={self.weights[i]}, V={self.values[i]}'
+                               for i in range(shown)])
+        if self.n > shown:
+            item_info += f'\n... ({self.n - shown} more items)'
+        return item_info
+
+    def _save_or_show(self, save_path, dpi, large):
+        if dpi is None:
+            dpi = self.LARGE_DPI if large else 300
+        if save_path:
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
+            print(f"  ✓ Saved: {save_path}")
+        else:
+            plt.show()
+        plt.close()
     
-    def visualize_dp_table(self, dp_table, save_path=None, title="Knapsack DP Table"):
+    def visualize_dp_table(self, dp_table, save_path=None, title="Knapsack DP Table", dpi=None):
         """
         Visualize a 2D DP table as a heatmap (for bottom-up approach).
         
@@ -38,45 +109,43 @@ class KnapsackVisualizer:
             dp_table: 2D list/array representing the DP table
             save_path: Optional path to save the figure
             title: Title for the plot
+            dpi: Resolution of the saved figure (300, or LARGE_DPI for large tables)
         """
         plt.figure(figsize=(14, 8))
         
         # Convert to numpy array
-        dp_array = np.array(dp_table)
+        dp_array = np.asarray(dp_table)
+        large = self._is_large(*dp_array.shape)
         
-        im = plt.imshow(dp_array, cmap='YlOrRd', aspect='auto')
+        if large:
+            image, grid = self._max_pool(dp_array)
+            im = plt.imshow(image, cmap='YlOrRd', aspect='auto', **grid)
+        else:
+            im = plt.imshow(dp_array, cmap='YlOrRd', aspect='auto')
         plt.colorbar(im, label='Maximum Value')
         
         # Add text annotations
-        for i in range(dp_array.shape[0]):
-            for j in range(dp_array.shape[1]):
-                plt.text(j, i, str(dp_array[i, j]), ha='center', va='center',
-                        color='black' if dp_array[i, j] < dp_array.max() * 0.6 else 'white',
-                        fontweight='bold')
+        if not large:
+            for i in range(dp_array.shape[0]):
+                for j in range(dp_array.shape[1]):
+                    plt.text(j, i, str(dp_array[i, j]), ha='center', va='center',
+                            color='black' if dp_array[i, j] < dp_array.max() * 0.6 else 'white',
+                            fontweight='bold')
         
         plt.xlabel('Capacity (w)', fontsize=12, fontweight='bold')
         plt.ylabel('Items (i)', fontsize=12, fontweight='bold')
         plt.title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.xticks(range(self.capacity + 1))
-        plt.yticks(range(self.n + 1))
+        self._set_ticks(plt.gca())
         
         # Add item information
-        item_info = '\n'.join([f'Item {i}: W={self.weights[i]}, V={self.values[i]}' 
-                               for i in range(self.n)])
-        plt.text(1.15, 0.5, item_info, transform=plt.gca().transAxes,
+        plt.text(1.15, 0.5, self._item_info(), transform=plt.gca().transAxes,
                 fontsize=10, verticalalignment='center',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  ✓ Saved: {save_path}")
-        else:
-            plt.show()
-        plt.close()
+        self._save_or_show(save_path, dpi, large)
     
-    def visualize_memo_table(self, memo_dict, save_path=None, title="Memoization Table"):
+    def visualize_memo_table(self, memo_dict, save_path=None, title="Memoization Table", dpi=None):
         """
         Visualize a memoization dictionary (for top-down approach).
         Shows only the states that were computed.
@@ -85,60 +154,70 @@ class KnapsackVisualizer:
             memo_dict: Dictionary with (n, capacity) as keys
             save_path: Optional path to save the figure
             title: Title for the plot
+            dpi: Resolution of the saved figure (300, or LARGE_DPI for large tables)
         """
         plt.figure(figsize=(14, 8))
         
-        # Create a full table initialized with -1 (not computed)
-        full_table = np.full((self.n + 1, self.capacity + 1), -1, dtype=int)
-        
-        # Fill in the memoized values
-        for (n, w), value in memo_dict.items():
-            if n <= self.n and w <= self.capacity:
-                full_table[n, w] = value
+        rows, cols = self.n + 1, self.capacity + 1
+        large = self._is_large(rows, cols)
+        
+        if large:
+            # Pool straight from the dict so the full table is never allocated
+            block_rows, block_cols = self._blocks(rows, cols)
+            full_table = np.full((-(-rows // block_rows), -(-cols // block_cols)), -1, dtype=np.int64)
+            if memo_dict:
+                keys = np.array(list(memo_dict.keys()), dtype=np.int64)
+                vals = np.fromiter(memo_dict.values(), dtype=np.int64, count=len(memo_dict))
+                inside = (keys[:, 0] <= self.n) & (keys[:, 1] <= self.capacity)
+                np.maximum.at(full_table, (keys[inside, 0] // block_rows, keys[inside, 1] // block_cols),
+                              vals[inside])
+            grid = self._grid_kwargs(rows, cols)
+        else:
+            # Create a full table initialized with -1 (not computed)
+            full_table = np.full((rows, cols), -1, dtype=int)
+            
+            # Fill in the memoized values
+            for (n, w), value in memo_dict.items():
+                if n <= self.n and w <= self.capacity:
+                    full_table[n, w] = value
+            grid = {}
         
         # Create custom colormap: gray for -1, YlOrRd for computed values
         masked_array = np.ma.masked_where(full_table == -1, full_table)
         
-        plt.imshow(full_table, cmap='binary', aspect='auto', alpha=0.3)
-        im = plt.imshow(masked_array, cmap='YlOrRd', aspect='auto')
+        plt.imshow(full_table, cmap='binary', aspect='auto', alpha=0.3, **grid)
+        im = plt.imshow(masked_array, cmap='YlOrRd', aspect='auto', **grid)
         plt.colorbar(im, label='Maximum Value')
         
         # Add text annotations
-        for i in range(full_table.shape[0]):
-            for j in range(full_table.shape[1]):
-                if full_table[i, j] >= 0:
-                    color = 'black' if full_table[i, j] < masked_array.max() * 0.6 else 'white'
-                    plt.text(j, i, str(full_table[i, j]), ha='center', va='center',
-                            color=color, fontweight='bold')
-                else:
-                    plt.text(j, i, '·', ha='center', va='center',
-                            color='lightgray', fontsize=20)
+        if not large:
+            for i in range(full_table.shape[0]):
+                for j in range(full_table.shape[1]):
+                    if full_table[i, j] >= 0:
+                        color = 'black' if full_table[i, j] < masked_array.max() * 0.6 else 'white'
+                        plt.text(j, i, str(full_table[i, j]), ha='center', va='center',
+                                color=color, fontweight='bold')
+                    else:
+                        plt.text(j, i, '·', ha='center', va='center',
+                                color='lightgray', fontsize=20)
         
         plt.xlabel('Capacity (w)', fontsize=12, fontweight='bold')
         plt.ylabel('Items (n)', fontsize=12, fontweight='bold')
         plt.title(f'{title} - Computed States: {len(memo_dict)}', 
                   fontsize=14, fontweight='bold', pad=20)
-        plt.xticks(range(self.capacity + 1))
-        plt.yticks(range(self.n + 1))
+        self._set_ticks(plt.gca())
         
         # Add item information
-        item_info = '\n'.join([f'Item {i}: W={self.weights[i]}, V={self.values[i]}' 
-                               for i in range(self.n)])
-        item_info += f'\n\nStates computed:\n{len(memo_dict)}/{(self.n+1)*(self.capacity+1)}'
+        item_info = self._item_info()
+        item_info += f'\n\nStates computed:\n{len(memo_dict)}/{rows * cols}'
         plt.text(1.15, 0.5, item_info, transform=plt.gca().transAxes,
                 fontsize=10, verticalalignment='center',
                 bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
         plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  ✓ Saved: {save_path}")
-        else:
-            plt.show()
-        plt.close()
+        self._save_or_show(save_path, dpi, large)
     
-    def visualize_solution(self, selected_items, max_value, save_path=None):
+    def visualize_solution(self, selected_items, max_value, save_path=None, quantities=None):
         """
         Visualize the selected items and solution.
         
@@ -146,12 +225,19 @@ class KnapsackVisualizer:
             selected_items: List of selected item indices
             max_value: Maximum value achieved
             save_path: Optional path to save the figure
+            quantities: Optional copies taken of each item (bounded and
+                unbounded variants, see ks_bounded); selected_items may then
+                be None
         """
+        if quantities is None:
+            quantities = [1 if i in selected_items else 0 for i in range(self.n)]
+        selected_items = [i for i in range(self.n) if quantities[i] > 0]
+
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
         
         # Left plot: Items comparison
         items = list(range(self.n))
-        selected = [i in selected_items for i in items]
+        selected = [quantities[i] > 0 for i in items]
         colors = ['#2ecc71' if s else '#e74c3c' for s in selected]
         
         x = np.arange(len(items))
@@ -175,12 +261,16 @@ class KnapsackVisualizer:
             ratio = v / w if w > 0 else 0
             ax1.text(i, max(w, v) + 0.5, f'Ratio: {ratio:.2f}',
                     ha='center', fontsize=9, fontweight='bold')
+            if quantities[i] > 1:
+                ax1.text(i, max(w, v) * 0.5, f'×{quantities[i]}',
+                        ha='center', fontsize=11, fontweight='bold')
         
         # Right plot: Solution summary
         ax2.axis('off')
         
-        total_weight = sum(self.weights[i] for i in selected_items)
-        total_value = sum(self.values[i] for i in selected_items)
+        total_weight = sum(self.weights[i] * quantities[i] for i in selected_items)
+        total_value = sum(self.values[i] * quantities[i] for i in selected_items)
+        copies = sum(quantities[i] for i in selected_items)
         
         summary_text = f"""
         ╔═══════════════════════════════════════╗
@@ -189,8 +279,8 @@ class KnapsackVisualizer:
         
         Capacity: {self.capacity}
         
-        Selected Items: {len(selected_items)} out of {self.n}
-        {', '.join([f'Item {i}' for i in selected_items])}
+        Selected Items: {len(selected_items)} out of {self.n} ({copies} copies)
+        {', '.join([f'Item {i}' + (f' ×{quantities[i]}' if quantities[i] > 1 else '') for i in selected_items])}
         
         ───────────────────────────────────────
         
@@ -206,6 +296,8 @@ class KnapsackVisualizer:
         
         for i in selected_items:
             summary_text += f"\n  • Item {i}: Weight={self.weights[i]}, Value={self.values[i]}"
+            if quantities[i] > 1:
+                summary_text += f", Quantity={quantities[i]}"
         
         summary_text += f"""
         
@@ -234,7 +326,7 @@ class KnapsackVisualizer:
             plt.show()
         plt.close()
     
-    def visualize_backtrack(self, dp_table, selected_items, save_path=None):
+    def visualize_backtrack(self, dp_table, selected_items, save_path=None, dpi=None):
         """
         Visualize the backtracking path through the DP table (bottom-up).
         
@@ -242,6 +334,7 @@ class KnapsackVisualizer:
             dp_table: 2D DP table
             selected_items: List of selected item indices
             save_path: Optional path to save the figure
+            dpi: Resolution of the saved figure (300, or LARGE_DPI for large tables)
         """
         # Reconstruct the backtracking path
         path = []
@@ -258,37 +351,47 @@ class KnapsackVisualizer:
         # Create visualization
         fig, ax = plt.subplots(figsize=(14, 8))
         
-        dp_array = np.array(dp_table)
-        
-        # Create mask for backtracking path
-        mask = np.zeros_like(dp_array, dtype=bool)
-        for (i, w) in path:
-            mask[i, w] = True
-        
-        # Plot heatmap with path highlighted
-        im = ax.imshow(dp_array, cmap='YlOrRd', aspect='auto', alpha=0.3)
-        
-        # Highlight the path
-        path_array = np.copy(dp_array).astype(float)
-        path_array[~mask] = np.nan
-        im2 = ax.imshow(path_array, cmap='Greens', aspect='auto', alpha=1.0)
-        
-        plt.colorbar(im2, ax=ax, label='Maximum Value')
-        
-        # Add text annotations
-        for i in range(dp_array.shape[0]):
-            for j in range(dp_array.shape[1]):
-                color = 'darkgreen' if mask[i, j] else 'gray'
-                weight = 'bold' if mask[i, j] else 'normal'
-                ax.text(j, i, str(dp_array[i, j]), ha='center', va='center',
-                       color=color, fontweight=weight)
-        
-        # Draw arrows along the path
-        for k in range(len(path) - 1):
-            i1, w1 = path[k]
-            i2, w2 = path[k + 1]
-            ax.annotate('', xy=(w2, i2), xytext=(w1, i1),
-                       arrowprops=dict(arrowstyle='->', lw=2, color='blue'))
+        dp_array = np.asarray(dp_table)
+        large = self._is_large(*dp_array.shape)
+        
+        if large:
+            # Pooled heatmap with the whole path as one line collection
+            image, grid = self._max_pool(dp_array)
+            im = ax.imshow(image, cmap='YlOrRd', aspect='auto', alpha=0.6, **grid)
+            plt.colorbar(im, ax=ax, label='Maximum Value')
+            points = np.array([(w, i) for i, w in path], dtype=float)
+            ax.add_collection(LineCollection([points], colors='blue', linewidths=2))
+            ax.plot(points[:, 0], points[:, 1], 'o', color='darkgreen', markersize=3)
+        else:
+            # Create mask for backtracking path
+            mask = np.zeros_like(dp_array, dtype=bool)
+            for (i, w) in path:
+                mask[i, w] = True
+            
+            # Plot heatmap with path highlighted
+            im = ax.imshow(dp_array, cmap='YlOrRd', aspect='auto', alpha=0.3)
+            
+            # Highlight the path
+            path_array = np.copy(dp_array).astype(float)
+            path_array[~mask] = np.nan
+            im2 = ax.imshow(path_array, cmap='Greens', aspect='auto', alpha=1.0)
+            
+            plt.colorbar(im2, ax=ax, label='Maximum Value')
+            
+            # Add text annotations
+            for i in range(dp_array.shape[0]):
+                for j in range(dp_array.shape[1]):
+                    color = 'darkgreen' if mask[i, j] else 'gray'
+                    weight = 'bold' if mask[i, j] else 'normal'
+                    ax.text(j, i, str(dp_array[i, j]), ha='center', va='center',
+                           color=color, fontweight=weight)
+            
+            # Draw arrows along the path
+            for k in range(len(path) - 1):
+                i1, w1 = path[k]
+                i2, w2 = path[k + 1]
+                ax.annotate('', xy=(w2, i2), xytext=(w1, i1),
+                           arrowprops=dict(arrowstyle='->', lw=2, color='blue'))
         
         ax.set_xlabel('Capacity (w)', fontsize=12, fontweight='bold')
         ax.set_ylabel('Items (i)', fontsize=12, fontweight='bold')
@@ -296,21 +399,17 @@ class KnapsackVisualizer:
                     fontsize=14, fontweight='bold', pad=20)
         
         plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  ✓ Saved: {save_path}")
-        else:
-            plt.show()
-        plt.close()
+        self._save_or_show(save_path, dpi, large)
     
     def compare_approaches(self, bottom_up_stats, top_down_stats, save_path=None):
         """
         Compare bottom-up vs top-down approaches.
         
         Args:
-            bottom_up_stats: Dict with keys: 'time', 'space', 'states_computed'
-            top_down_stats: Dict with keys: 'time', 'space', 'states_computed'
+            bottom_up_stats: Dict with keys: 'time', 'space', 'states_computed',
+                or the instrumentation.SolveStats filled by the solver
+            top_down_stats: Dict with keys: 'time', 'space', 'states_computed',
+                or the instrumentation.SolveStats filled by the solver
             save_path: Optional path to save the figure
         """
         fig, axes = plt.subplots(1, 3, figsize=(18, 6))